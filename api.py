@@ -1,8 +1,10 @@
 # File: api.py
 # FastAPI Email Service API
 
+import asyncio
 import logging
 import os
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
@@ -10,9 +12,10 @@ from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from prometheus_fastapi_instrumentator import Instrumentator
+from prometheus_fastapi_instrumentator.metrics import default as default_http_metrics
 from pydantic import BaseModel
 
-from config.logging_config import setup_logging
+from config.logging_config import setup_logging, start_queue_logging, stop_queue_logging
 from config.structured_logging import setup_structured_logging, get_logger as get_struct_logger
 from email_system import EmailConfig, EmailPriority, EmailProvider, EmailService
 from middleware import AccessLoggingMiddleware, ExceptionHandlerMiddleware, RequestIDMiddleware
@@ -47,17 +50,34 @@ app = FastAPI(
 
 # Initialize Prometheus instrumentator for automatic HTTP metrics (RED pattern)
 # This provides: request_count, request_duration, response_size, etc.
+# The handler label is the matched route template (e.g. "/send"), never the raw
+# URL path; unmatched requests (404s) are dropped so random URLs cannot create
+# new series. Excluded handlers are regexes, so anchor them to match exactly.
 instrumentator = Instrumentator(
-    should_group_status_codes=False,  # Track exact status codes
+    should_group_status_codes=True,   # Status classes (2xx/4xx/5xx) keep series bounded
     should_ignore_untemplated=True,   # Ignore requests to unknown endpoints
     should_respect_env_var=True,      # Respect ENABLE_METRICS env var
     should_instrument_requests_inprogress=True,  # Track concurrent requests
-    excluded_handlers=["/metrics", "/health"],   # Don't track internal endpoints
+    excluded_handlers=[  # Don't track internal endpoints or the interactive docs
+        "^/metrics$",
+        "^/health$",
+        "^/docs",  # Also /docs/oauth2-redirect
+        "^/redoc$",
+        r"^/openapi\.json$",
+    ],
     env_var_name="ENABLE_METRICS",
     inprogress_name="http_requests_inprogress",
     inprogress_labels=True,
 )
 
+# Default HTTP metrics with buckets sized for this API (must be added before instrument())
+instrumentator.add(
+    default_http_metrics(
+        latency_highr_buckets=metrics.HTTP_LATENCY_HIGHR_BUCKETS,
+        latency_lowr_buckets=metrics.HTTP_LATENCY_LOWR_BUCKETS,
+    )
+)
+
 # Instrument the FastAPI app (automatically adds HTTP metrics)
 instrumentator.instrument(app)
 
@@ -76,7 +96,8 @@ app.add_middleware(
 app.add_middleware(
     AccessLoggingMiddleware,
     log_body=False,  # DISABLED: body logging consumes stream, breaks Pydantic parsing!
-    max_body_length=1000
+    max_body_length=1000,
+    skip_paths=("/metrics", "/health"),  # Polled by Prometheus / healthchecks
 )
 app.add_middleware(RequestIDMiddleware)
 
@@ -91,6 +112,12 @@ config = EmailConfig(
 )
 email_service = EmailService(config)
 
+# Rendered /metrics exposition, shared by all scrapes within the TTL.
+# Kept shorter than the Prometheus scrape interval (15s) so data stays fresh.
+METRICS_CACHE_TTL = float(os.getenv("METRICS_CACHE_TTL", 5))
+_metrics_cache = {"expires_at": 0.0, "body": b""}
+_metrics_lock = asyncio.Lock()
+
 
 # Authentication Dependency
 async def verify_service_token(
@@ -124,7 +151,15 @@ async def verify_service_token(
     """
     logger.info("=== VERIFY_SERVICE_TOKEN DEPENDENCY CALLED ===")
     logger.info("Token received: %s", x_service_token[:20] + "..." if x_service_token else "None")
-    identity = await authenticator.verify_token(x_service_token)
+    try:
+        identity = await authenticator.verify_token(x_service_token)
+    except HTTPException as e:
+        # Exact auth failure reasons live here rather than in the HTTP status label
+        reason = e.detail.get("error", "failure") if isinstance(e.detail, dict) else "failure"
+        metrics.api_auth_attempts_total.labels(service_name="unknown", status=reason).inc()
+        raise
+
+    metrics.api_auth_attempts_total.labels(service_name=identity.name, status="success").inc()
     logger.info("=== AUTHENTICATION SUCCESSFUL: %s ===", identity.name)
 
     # Store service name in request state for access logging middleware
@@ -158,9 +193,17 @@ class StatsResponse(BaseModel):
     rate_limits: Dict[str, Dict[str, str]]
 
 
+# Loggers written from the request path; their handler I/O runs on background
+# threads so error/access logging never blocks the event loop
+QUEUED_LOGGERS = ("api", "api.access", "api.exceptions")
+_log_listeners = []
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the email service on startup"""
+    _log_listeners.extend(start_queue_logging(QUEUED_LOGGERS))
+
     await email_service.initialize()
 
     # Initialize audit trail with Redis client
@@ -186,6 +229,10 @@ async def shutdown_event():
     await email_service.shutdown()
     logger.info("Email API service stopped")
 
+    # Flush queued log records before the process exits
+    stop_queue_logging(_log_listeners)
+    _log_listeners.clear()
+
 
 @app.post("/send", response_model=EmailResponse)
 async def send_email(
@@ -218,17 +265,11 @@ async def send_email(
 
         # Track metrics
         recipient_count = len(request.recipients) if isinstance(request.recipients, list) else 1
-        metrics.emails_total.labels(
-            status="queued",
-            priority=request.priority.value,
-            provider=request.provider.value
-        ).inc(recipient_count)
-
-        metrics.queue_operations_total.labels(
-            operation="enqueue",
-            queue=request.priority.value,
-            status="success"
-        ).inc()
+        emails_queued, enqueue_ops = metrics.send_request_metrics(
+            request.priority.value, request.provider.value
+        )
+        emails_queued.inc(recipient_count)
+        enqueue_ops.inc()
 
         # Log to audit trail
         await audit_trail.log_service_call(
@@ -365,6 +406,9 @@ async def metrics_endpoint():
     - Redis connection health
     - Worker status and throughput
 
+    The rendered exposition is cached for METRICS_CACHE_TTL seconds (default 5),
+    so concurrent or repeated scrapes share one Redis stats call and one render.
+
     **Prometheus Configuration:**
     ```yaml
     scrape_configs:
@@ -375,24 +419,23 @@ async def metrics_endpoint():
 
     Or use Docker service discovery with label: `prometheus.scrape=true`
     """
-    # Update queue depth metrics before exposing
-    try:
-        stats = await email_service.get_stats()
-        metrics.queue_depth.labels(priority="high", queue_type="pending").set(
-            stats.get("queue_high", 0)
-        )
-        metrics.queue_depth.labels(priority="medium", queue_type="pending").set(
-            stats.get("queue_medium", 0)
-        )
-        metrics.queue_depth.labels(priority="low", queue_type="pending").set(
-            stats.get("queue_low", 0)
-        )
-    except Exception as e:
-        logger.warning("Failed to update queue metrics: %s", e)
+    async with _metrics_lock:
+        if time.monotonic() >= _metrics_cache["expires_at"]:
+            # Update queue depth metrics before exposing
+            try:
+                stats = await email_service.get_stats()
+                metrics.pending_queue_depth("high").set(stats.get("queue_high", 0))
+                metrics.pending_queue_depth("medium").set(stats.get("queue_medium", 0))
+                metrics.pending_queue_depth("low").set(stats.get("queue_low", 0))
+            except Exception as e:
+                logger.warning("Failed to update queue metrics: %s", e)
+
+            # Generate Prometheus metrics once per TTL window
+            _metrics_cache["body"] = generate_latest()
+            _metrics_cache["expires_at"] = time.monotonic() + METRICS_CACHE_TTL
 
-    # Generate and return Prometheus metrics
     return PlainTextResponse(
-        content=generate_latest().decode("utf-8"),
+        content=_metrics_cache["body"],
         media_type=CONTENT_TYPE_LATEST
     )
 
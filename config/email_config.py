@@ -29,6 +29,9 @@ class EmailConfig:
     retry_attempts: int = 3
     dead_letter_ttl: int = 86400 * 7  # 7 days
 
+    # Group recipient cache (seconds a resolved group member list is reused)
+    group_cache_ttl: int = 60
+
     # Templates
     template_directory: str = "/opt/email/templates"
 
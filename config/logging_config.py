@@ -23,9 +23,11 @@ Usage:
 import logging
 import logging.config
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 
 import yaml
 
@@ -276,6 +278,69 @@ def setup_logging(config_path: Optional[Path] = None) -> None:
     logger.debug("Debug logging is enabled")
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues the record untouched.
+
+    The stock prepare() formats the message and traceback in the calling
+    thread; records stay in-process here, so formatting is left to the
+    listener thread along with the I/O.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_queue_logging(logger_names: Iterable[str]) -> List[QueueListener]:
+    """
+    Move handler I/O for the given loggers onto background threads.
+
+    Each logger's configured handlers are replaced by a QueueHandler, and a
+    QueueListener drains the queue into the original handlers. Logging calls
+    on the event loop then only enqueue the record; formatting (including
+    tracebacks) and stream writes happen off the loop.
+
+    Call after setup_logging(), typically from the app startup hook, and pass
+    the returned listeners to stop_queue_logging() on shutdown.
+
+    Args:
+        logger_names: Names of loggers whose handlers should be queued
+
+    Returns:
+        List of started QueueListener instances
+    """
+    listeners = []
+
+    for name in logger_names:
+        target = logging.getLogger(name)
+        handlers = [h for h in target.handlers if not isinstance(h, QueueHandler)]
+        if not handlers:
+            continue
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(_DeferredQueueHandler(log_queue))
+
+        listener.start()
+        listeners.append(listener)
+
+    return listeners
+
+
+def stop_queue_logging(listeners: Iterable[QueueListener]) -> None:
+    """
+    Flush and stop listeners started by start_queue_logging().
+
+    Args:
+        listeners: Listeners returned by start_queue_logging()
+    """
+    for listener in listeners:
+        listener.stop()
+
+
 # Convenience function for testing
 def test_logging():
     """
@@ -20,6 +20,7 @@ Based on best practices from the expert FastAPI + Uvicorn logging guide.
 
 import logging
 import sys
+from contextlib import contextmanager
 
 import structlog
 
@@ -168,6 +169,29 @@ def bind_context(**kwargs):
     structlog.contextvars.bind_contextvars(**kwargs)
 
 
+@contextmanager
+def bound_context(**kwargs):
+    """
+    Bind context for the duration of a block, then restore the previous values.
+
+    Uses the contextvar tokens returned by bind_contextvars, so only the keys
+    bound here are reset (O(1) per key) and context bound by callers or
+    concurrent requests is left untouched, unlike clear_context().
+
+    Args:
+        **kwargs: Key-value pairs to bind (e.g., request_id, user_id)
+
+    Usage:
+        with bound_context(request_id=request_id):
+            logger.info("processing_request")  # Includes request_id
+    """
+    tokens = structlog.contextvars.bind_contextvars(**kwargs)
+    try:
+        yield
+    finally:
+        structlog.contextvars.reset_contextvars(**tokens)
+
+
 def clear_context():
     """
     Clear all bound context.
@@ -205,11 +229,10 @@ logger = structlog.get_logger(__name__)
 logger.info("user_registered", user_id=123, email="user@example.com")
 
 # With bound context (in middleware):
-from config.structured_logging import bind_context, clear_context
+from config.structured_logging import bound_context
 
-bind_context(request_id="abc123", service_name="email-api")
-logger.info("processing_email", job_id="job_456")
-clear_context()
+with bound_context(request_id="abc123", service_name="email-api"):
+    logger.info("processing_email", job_id="job_456")
 
 # Error logging with exception:
 try:
@@ -5,6 +5,22 @@ from typing import Dict
 
 from email_system import EmailConfig, EmailPriority, EmailProvider, EmailService
 
+# FreeFace link prefixes (only the token/id varies per email)
+FREEFACE_BASE_URL = "https://freeface.com"
+VERIFY_URL = FREEFACE_BASE_URL + "/verify/"
+RESET_URL = FREEFACE_BASE_URL + "/reset/"
+JOIN_URL = FREEFACE_BASE_URL + "/join/"
+GROUP_URL = FREEFACE_BASE_URL + "/group/"
+
+PREVIEW_LENGTH = 100
+
+
+def message_preview(message: str, length: int = PREVIEW_LENGTH) -> str:
+    """Truncate a message for notification previews (ellipsis only when cut)"""
+    if len(message) > length:
+        return message[:length] + "..."
+    return message
+
 
 async def integrate_with_user_api():
     """Example integration with User API (Port 8001)"""
@@ -22,7 +38,7 @@ async def integrate_with_user_api():
             template="user_welcome.html",
             data={
                 "name": user_data["name"],
-                "verification_link": f"https://freeface.com/verify/{user_data['verification_token']}",
+                "verification_link": f"{VERIFY_URL}{user_data['verification_token']}",
             },
             priority=EmailPriority.HIGH,
             provider=EmailProvider.SENDGRID,
@@ -34,7 +50,7 @@ async def integrate_with_user_api():
         await email_service.send_email(
             recipients=email,
             template="password_reset.html",
-            data={"reset_link": f"https://freeface.com/reset/{reset_token}"},
+            data={"reset_link": f"{RESET_URL}{reset_token}"},
             priority=EmailPriority.HIGH,
         )
 
@@ -56,7 +72,7 @@ async def integrate_with_group_api():
                 "inviter": invitation_data["inviter_name"],
                 "group_name": invitation_data["group_name"],
                 "description": invitation_data.get("description", ""),
-                "join_link": f"https://freeface.com/join/{invitation_data['group_id']}",
+                "join_link": f"{JOIN_URL}{invitation_data['group_id']}",
             },
             priority=EmailPriority.MEDIUM,
         )
@@ -71,7 +87,7 @@ async def integrate_with_group_api():
                 "sender": "FreeFace",
                 "group_name": "Your Group",  # Would be fetched from DB
                 "preview": f"{new_member_name} joined the group!",
-                "group_link": f"https://freeface.com/group/{group_id}",
+                "group_link": f"{GROUP_URL}{group_id}",
             },
             priority=EmailPriority.LOW,
         )
@@ -97,8 +113,8 @@ async def integrate_with_message_api():
             data={
                 "sender": message_data["sender_name"],
                 "group_name": message_data["group_name"],
-                "preview": message_data["message"][:100] + "...",
-                "group_link": f"https://freeface.com/group/{message_data['group_id']}",
+                "preview": message_preview(message_data["message"]),
+                "group_link": f"{GROUP_URL}{message_data['group_id']}",
             },
             priority=EmailPriority.MEDIUM,
         )
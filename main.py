@@ -4,7 +4,7 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
 
 from config.email_config import EmailConfig
 from config.logging_config import setup_logging
@@ -61,7 +61,7 @@ async def main():
     )
 
     # Example: Schedule newsletter
-    scheduled_time = datetime.utcnow() + timedelta(hours=1)
+    scheduled_time = time.time() + 3600  # One hour from now
     job_id = await email_service.send_email(
         recipients="group:newsletter_subscribers",
         template="weekly_newsletter",
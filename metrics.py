@@ -12,25 +12,68 @@ Metrics Categories:
 - Worker: Worker pool health and throughput
 """
 
+import sys
 import time
-from functools import wraps
-from typing import Callable, Optional
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Optional
 
 from prometheus_client import (
     Counter,
     Gauge,
     Histogram,
-    Info,
-    Summary,
 )
 
+# ============================================================================
+# Label Values
+# ============================================================================
+
+# Interned label values for the small, fixed label sets used on hot paths.
+# Decorators resolve their labels against these tables once, so every
+# labels() lookup hashes and compares the same string objects.
+PRIORITY_LABELS: Dict[str, str] = {p: sys.intern(p) for p in ("low", "medium", "high")}
+PROVIDER_LABELS: Dict[str, str] = {
+    p: sys.intern(p) for p in ("sendgrid", "mailgun", "aws_ses", "smtp")
+}
+STATUS_LABELS: Dict[str, str] = {s: sys.intern(s) for s in ("success", "error")}
+
+STATUS_SUCCESS = STATUS_LABELS["success"]
+STATUS_ERROR = STATUS_LABELS["error"]
+
+
+# Exception class names treated as retriable provider errors
+_RETRIABLE_ERRORS = frozenset({
+    "TimeoutError",
+    "ConnectionError",
+    "ConnectionResetError",
+    "ConnectionRefusedError",
+    "SMTPServerDisconnected",
+    "SMTPConnectError",
+    "SMTPConnectTimeoutError",
+    "SMTPTimeoutError",
+    "SMTPReadTimeoutError",
+    "ReadTimeout",
+    "ConnectTimeout",
+})
+
+# Pre-stringified is_retriable label values
+_RETRIABLE_LABELS = {True: sys.intern("True"), False: sys.intern("False")}
+
+
+def _label(table: Dict[str, str], value: str) -> str:
+    """Return the interned label value, falling back to interning unknown values"""
+    return table.get(value) or sys.intern(value)
+
+
 # ============================================================================
 # Service Info
 # ============================================================================
 
-email_service_info = Info(
-    "email_service",
-    "Email service version and configuration information"
+# Constant 1 with the build info as labels (same series name an Info metric
+# would export, but a plain gauge set once at startup)
+email_service_info = Gauge(
+    "email_service_info",
+    "Email service version and configuration information",
+    ["version", "environment", "metrics_version"]
 )
 
 # ============================================================================
@@ -112,11 +155,12 @@ provider_available = Gauge(
     ["provider", "type"]  # type: smtp, api
 )
 
-# Provider response time
-provider_response_time = Summary(
+# Provider response time (Histogram: cheap observe() and aggregatable across workers)
+provider_response_time = Histogram(
     "email_service_provider_response_seconds",
     "Provider response time",
-    ["provider", "operation"]  # operation: connect, send, confirm
+    ["provider", "operation"],  # operation: connect, send, confirm
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
 )
 
 # Provider errors
@@ -215,6 +259,14 @@ redis_pool_connections = Gauge(
 # API Metrics (HTTP Layer - complementing FastAPI instrumentator)
 # ============================================================================
 
+# Buckets for the instrumentator's HTTP latency histograms. API handlers only
+# enqueue to Redis, so the upstream defaults (21 buckets up to 60s) are mostly
+# empty. The unlabelled high-resolution histogram keeps enough buckets for
+# percentiles; the per-(method, handler) one stays tiny because it is
+# multiplied by every route.
+HTTP_LATENCY_HIGHR_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+HTTP_LATENCY_LOWR_BUCKETS = (0.05, 0.25, 1.0)
+
 # API authentication
 api_auth_attempts_total = Counter(
     "email_service_api_auth_attempts_total",
@@ -247,6 +299,30 @@ active_connections = Gauge(
     ["type"]  # type: redis, smtp, http
 )
 
+# ============================================================================
+# Cached Label Children (hot request paths)
+# ============================================================================
+
+@lru_cache(maxsize=256)
+def send_request_metrics(priority: str, provider: str):
+    """
+    Return the pre-bound (emails_total, queue_operations_total) children for /send
+
+    Label values come from the EmailPriority/EmailProvider enums, so the cache
+    stays bounded and each request skips the labels() lookup entirely.
+    """
+    return (
+        emails_total.labels(status="queued", priority=priority, provider=provider),
+        queue_operations_total.labels(operation="enqueue", queue=priority, status=STATUS_SUCCESS),
+    )
+
+
+@lru_cache(maxsize=16)
+def pending_queue_depth(priority: str):
+    """Return the pre-bound queue_depth child for a pending priority queue"""
+    return queue_depth.labels(priority=priority, queue_type="pending")
+
+
 # ============================================================================
 # Decorator Utilities for Easy Instrumentation
 # ============================================================================
@@ -260,20 +336,23 @@ def track_email_delivery(priority: str, provider: str):
         async def send_email(...):
             ...
     """
+    priority = _label(PRIORITY_LABELS, priority)
+    provider = _label(PROVIDER_LABELS, provider)
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            status = "success"
+            start_time = time.perf_counter()
+            status = STATUS_SUCCESS
 
             try:
                 result = await func(*args, **kwargs)
                 return result
             except Exception as e:
-                status = "error"
+                status = STATUS_ERROR
                 raise
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 emails_total.labels(
                     status=status,
                     priority=priority,
@@ -298,16 +377,18 @@ def track_queue_operation(operation: str, queue: str):
         async def enqueue_email(...):
             ...
     """
+    queue = _label(PRIORITY_LABELS, queue)
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            status = "success"
+            status = STATUS_SUCCESS
 
             try:
                 result = await func(*args, **kwargs)
                 return result
             except Exception:
-                status = "error"
+                status = STATUS_ERROR
                 raise
             finally:
                 queue_operations_total.labels(
@@ -329,26 +410,26 @@ def track_provider_call(provider: str, operation: str = "send"):
         async def send_via_sendgrid(...):
             ...
     """
+    provider = _label(PROVIDER_LABELS, provider)
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 result = await func(*args, **kwargs)
                 return result
             except Exception as e:
                 error_type = type(e).__name__
-                is_retriable = "timeout" in error_type.lower() or "connection" in error_type.lower()
-
                 provider_errors_total.labels(
                     provider=provider,
                     error_type=error_type,
-                    is_retriable=str(is_retriable)
+                    is_retriable=_RETRIABLE_LABELS[error_type in _RETRIABLE_ERRORS]
                 ).inc()
                 raise
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 provider_response_time.labels(
                     provider=provider,
                     operation=operation
@@ -362,22 +443,39 @@ def track_provider_call(provider: str, operation: str = "send"):
 # Metrics Initialization
 # ============================================================================
 
+METRICS_VERSION = "1.0.0"
+
+# (provider, type) pairs exported by provider_available
+_PROVIDERS = (
+    ("sendgrid", "api"),
+    ("mailgun", "api"),
+    ("smtp", "smtp"),
+)
+
+
 def initialize_metrics(service_version: str = "1.0.0", environment: str = "production"):
     """
     Initialize service info metrics
 
     Call this once at application startup
     """
-    email_service_info.info({
-        "version": service_version,
-        "environment": environment,
-        "metrics_version": "1.0.0"
-    })
+    email_service_info.labels(
+        version=service_version,
+        environment=environment,
+        metrics_version=METRICS_VERSION,
+    ).set(1)
 
     # Set initial gauges
     redis_connected.set(0)
     workers_active.set(0)
 
     # Initialize provider availability (unknown state)
-    for provider in ["sendgrid", "mailgun", "smtp"]:
-        provider_available.labels(provider=provider, type="api").set(0)
+    for provider, provider_type in _PROVIDERS:
+        provider_available.labels(provider=provider, type=provider_type).set(0)
+
+    # Create the request-path label children up front: label tuples are
+    # resolved once here, and every series is exported (at 0) from the first scrape
+    for priority in PRIORITY_LABELS.values():
+        pending_queue_depth(priority)
+        for provider in PROVIDER_LABELS.values():
+            send_request_metrics(priority, provider)
@@ -21,15 +21,19 @@ Based on best practices from the expert FastAPI logging guide.
 
 import logging
 import time
-from typing import Callable
+from typing import Iterable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("api.access")
 
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
 
-class AccessLoggingMiddleware(BaseHTTPMiddleware):
+# Request bodies larger than this are never read for logging
+MAX_LOGGABLE_CONTENT_LENGTH = 1024 * 1024
+
+
+class AccessLoggingMiddleware:
     """
     Log all HTTP requests in structured format with full context.
 
@@ -51,20 +55,33 @@ class AccessLoggingMiddleware(BaseHTTPMiddleware):
         "request_size": 1024,
         "response_size": 256
     }
+
+    Implemented as a pure ASGI middleware (no BaseHTTPMiddleware): the response
+    status and size are captured by wrapping ``send``, so no extra task or
+    memory stream is created per request.
     """
 
-    def __init__(self, app, log_body: bool = False, max_body_length: int = 1000):
+    def __init__(
+        self,
+        app: ASGIApp,
+        log_body: bool = False,
+        max_body_length: int = 1000,
+        skip_paths: Iterable[str] = (),
+    ):
         """
         Initialize access logging middleware
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             log_body: Whether to log request/response bodies (USE ONLY IN DEBUG!)
             max_body_length: Maximum body length to log (prevent huge logs)
+            skip_paths: Exact paths passed through without access logging
+                (e.g. scrape and health check endpoints)
         """
-        super().__init__(app)
+        self.app = app
         self.log_body = log_body
         self.max_body_length = max_body_length
+        self.skip_paths = frozenset(skip_paths)
 
         if self.log_body:
             logger.warning(
@@ -72,142 +89,209 @@ class AccessLoggingMiddleware(BaseHTTPMiddleware):
                 "This should ONLY be used in development/debug environments!"
             )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and log access information
 
         Args:
-            request: Incoming FastAPI request
-            call_next: Next middleware/route handler
-
-        Returns:
-            Response from handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        state = scope.setdefault("state", {})
+        method = scope["method"]
+        path = scope["path"]
 
         # Extract request ID (set by RequestIDMiddleware)
-        request_id = getattr(request.state, "request_id", "unknown")
+        request_id = state.get("request_id", "unknown")
 
-        # Extract client information
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        user_agent = "unknown"
+        content_type = b""
+        content_length = None
+        for key, value in scope["headers"]:
+            if key == b"user-agent":
+                user_agent = value.decode("latin-1")
+            elif key == b"content-type":
+                content_type = value
+            elif key == b"content-length":
+                content_length = value
 
-        # Extract authentication info (set by auth middleware)
-        service_name = getattr(request.state, "service_name", None)
+        client = scope.get("client")
 
         # Build request context for logging
         request_context = {
             "request_id": request_id,
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": str(request.url.query) if request.url.query else None,
-            "client_ip": client_ip,
+            "method": method,
+            "path": path,
+            "query_params": scope.get("query_string", b"").decode("latin-1") or None,
+            "client_ip": client[0] if client else "unknown",
             "user_agent": user_agent,
         }
 
-        # Add service name if authenticated
-        if service_name:
-            request_context["service_name"] = service_name
-
         # Optionally log request body (DEBUG ONLY!)
-        if self.log_body and request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                if len(body) <= self.max_body_length:
-                    request_context["request_body"] = body.decode("utf-8", errors="replace")
-                else:
-                    request_context["request_body"] = (
-                        f"[Body too large: {len(body)} bytes, truncated]"
-                    )
-            except Exception as e:
-                logger.debug("Failed to read request body: %s", e)
+        if self.log_body and method in _BODY_METHODS:
+            if not content_type.startswith(b"application/json"):
+                request_context["request_body"] = "[Body not logged: non-JSON content]"
+            elif content_length is not None and (
+                not content_length.isdigit()
+                or int(content_length) > MAX_LOGGABLE_CONTENT_LENGTH
+            ):
+                # Non-numeric lengths come from the client too: treat as unloggable
+                request_context["request_body"] = (
+                    f"[Body too large: {content_length.decode('latin-1')} bytes, not logged]"
+                )
+            else:
+                try:
+                    receive = await self._peek_body(receive, request_context)
+                except Exception as e:
+                    logger.debug("Failed to read request body: %s", e)
 
         # Log incoming request at DEBUG level
-        logger.debug(
-            "HTTP Request: %s %s [request_id=%s]",
-            request.method,
-            request.url.path,
-            request_id,
-            extra=request_context
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "HTTP Request: %s %s [request_id=%s]",
+                method,
+                path,
+                request_id,
+                extra=request_context
+            )
+
+        response_start = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_start.update(message)
+            await send(message)
 
         # Process request
         try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # Log exception during request processing
+            duration_ms = int((time.perf_counter() - start_time) * 1_000_000) / 1000
 
-            # Build response context
-            response_context = {
+            error_context = {
                 **request_context,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
+                "duration_ms": duration_ms,
+                "error_type": type(e).__name__,
+                "error_message": str(e),
             }
 
+            logger.error(
+                "HTTP Request EXCEPTION: %s %s - %s after %.2fms [request_id=%s]",
+                method,
+                path,
+                type(e).__name__,
+                duration_ms,
+                request_id,
+                exc_info=True,  # Include full traceback
+                extra=error_context
+            )
+
+            # Re-raise to let exception middleware handle it
+            raise
+
+        # Calculate duration (whole microseconds, reported in ms)
+        duration_ms = int((time.perf_counter() - start_time) * 1_000_000) / 1000
+        status_code = response_start.get("status", 500)
+
+        # Use different log levels based on status code
+        if status_code >= 500:
+            log_level = logging.ERROR
+            log_message = "HTTP Request FAILED (5xx)"
+        elif status_code >= 400:
+            log_level = logging.WARNING
+            log_message = "HTTP Request ERROR (4xx)"
+        else:
+            log_level = logging.INFO
+            log_message = "HTTP Request"
+
+        is_slow = duration_ms > 1000  # Slower than 1 second
+
+        # Only build the response context when a record will actually be emitted
+        if logger.isEnabledFor(log_level) or (is_slow and logger.isEnabledFor(logging.WARNING)):
+            response_context = request_context
+            response_context["status_code"] = status_code
+            response_context["duration_ms"] = duration_ms
+
+            # Extract authentication info (set by the auth dependency during the request)
+            service_name = state.get("service_name")
+            if service_name:
+                response_context["service_name"] = service_name
+
             # Add response size if available
-            if "content-length" in response.headers:
-                response_context["response_size"] = int(response.headers["content-length"])
-
-            # Log completed request at INFO level
-            # Use different log levels based on status code
-            if response.status_code >= 500:
-                log_level = logging.ERROR
-                log_message = "HTTP Request FAILED (5xx)"
-            elif response.status_code >= 400:
-                log_level = logging.WARNING
-                log_message = "HTTP Request ERROR (4xx)"
-            else:
-                log_level = logging.INFO
-                log_message = "HTTP Request"
+            for key, value in response_start.get("headers", ()):
+                if key == b"content-length":
+                    response_context["response_size"] = int(value)
+                    break
 
             logger.log(
                 log_level,
                 "%s: %s %s - %d [%.2fms] [request_id=%s]",
                 log_message,
-                request.method,
-                request.url.path,
-                response.status_code,
+                method,
+                path,
+                status_code,
                 duration_ms,
                 request_id,
                 extra=response_context
             )
 
             # Log slow requests at WARNING level
-            if duration_ms > 1000:  # Slower than 1 second
+            if is_slow:
                 logger.warning(
                     "SLOW REQUEST detected: %s %s took %.2fms [request_id=%s]",
-                    request.method,
-                    request.url.path,
+                    method,
+                    path,
                     duration_ms,
                     request_id,
                     extra=response_context
                 )
 
-            return response
+    async def _peek_body(self, receive: Receive, request_context: dict) -> Receive:
+        """
+        Read at most max_body_length + 1 bytes of the request body for logging
 
-        except Exception as e:
-            # Log exception during request processing
-            duration_ms = (time.time() - start_time) * 1000
+        Only the chunks needed to decide whether the body fits are pulled from
+        the stream; they are replayed to the app before delegating to the
+        original receive channel, so large uploads are never fully buffered.
 
-            error_context = {
-                **request_context,
-                "duration_ms": round(duration_ms, 2),
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-            }
+        Args:
+            receive: Original ASGI receive channel
+            request_context: Log context to add the body to
 
-            logger.error(
-                "HTTP Request EXCEPTION: %s %s - %s after %.2fms [request_id=%s]",
-                request.method,
-                request.url.path,
-                type(e).__name__,
-                duration_ms,
-                request_id,
-                exc_info=True,  # Include full traceback
-                extra=error_context
+        Returns:
+            Receive channel that yields the consumed messages before delegating
+        """
+        messages = []
+        size = 0
+        more_body = True
+        while more_body and size <= self.max_body_length:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            size += len(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        if size <= self.max_body_length:
+            body = b"".join(message.get("body", b"") for message in messages)
+            request_context["request_body"] = body.decode("utf-8", errors="replace")
+        else:
+            request_context["request_body"] = (
+                f"[Body too large: more than {self.max_body_length} bytes, truncated]"
             )
 
-            # Re-raise to let exception middleware handle it
-            raise
+        async def replay_receive() -> Message:
+            if messages:
+                return messages.pop(0)
+            return await receive()
+
+        return replay_receive
@@ -14,16 +14,14 @@ Based on best practices from expert FastAPI security guidelines.
 
 import logging
 import traceback
-from typing import Callable
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("api.exceptions")
 
 
-class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
+class ExceptionHandlerMiddleware:
     """
     Catch and log all uncaught exceptions.
 
@@ -37,15 +35,15 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
     - Request ID correlation for troubleshooting
     """
 
-    def __init__(self, app, include_traceback_in_response: bool = False):
+    def __init__(self, app: ASGIApp, include_traceback_in_response: bool = False):
         """
         Initialize exception handler middleware
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             include_traceback_in_response: Include traceback in response (DEBUG ONLY!)
         """
-        super().__init__(app)
+        self.app = app
         self.include_traceback_in_response = include_traceback_in_response
 
         if self.include_traceback_in_response:
@@ -54,53 +52,63 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
                 "This should ONLY be used in development environments!"
             )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and catch any uncaught exceptions
 
         Args:
-            request: Incoming FastAPI request
-            call_next: Next middleware/route handler
-
-        Returns:
-            Response from handler or error response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        try:
-            # Process request normally
-            response = await call_next(request)
-            return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        except Exception as e:
-            # Get request context for logging
-            request_id = getattr(request.state, "request_id", "unknown")
-            service_name = getattr(request.state, "service_name", "unknown")
+        response_started = False
 
-            # Get full traceback
-            tb = traceback.format_exc()
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-            # Build error context
-            error_context = {
-                "request_id": request_id,
-                "service_name": service_name,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.url.query) if request.url.query else None,
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "traceback": tb,
-            }
+        try:
+            # Process request normally
+            await self.app(scope, receive, send_wrapper)
 
-            # Log the exception with full context
-            logger.error(
-                "UNCAUGHT EXCEPTION in API: %s %s - %s: %s [request_id=%s]",
-                request.method,
-                request.url.path,
-                type(e).__name__,
-                str(e),
-                request_id,
-                exc_info=True,  # Include full traceback in logs
-                extra=error_context
-            )
+        except Exception as e:
+            # Get request context for logging (request.state is backed by scope["state"])
+            state = scope.get("state", {})
+            request_id = state.get("request_id", "unknown")
+            service_name = state.get("service_name", "unknown")
+
+            if logger.isEnabledFor(logging.ERROR):
+                method = scope["method"]
+                path = scope["path"]
+
+                # Build error context
+                error_context = {
+                    "request_id": request_id,
+                    "service_name": service_name,
+                    "method": method,
+                    "path": path,
+                    "query_params": scope.get("query_string", b"").decode("latin-1") or None,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                }
+
+                # Log the exception with full context
+                logger.error(
+                    "UNCAUGHT EXCEPTION in API: %s %s - %s: %s [request_id=%s]",
+                    method,
+                    path,
+                    type(e).__name__,
+                    str(e),
+                    request_id,
+                    exc_info=True,  # Traceback is formatted only if a handler emits the record
+                    extra=error_context
+                )
 
             # Build error response
             error_response = {
@@ -111,12 +119,17 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
 
             # Optionally include traceback in response (DEVELOPMENT ONLY!)
             if self.include_traceback_in_response:
-                error_response["traceback"] = tb
+                error_response["traceback"] = traceback.format_exc()
                 error_response["error_type"] = type(e).__name__
                 error_response["error_details"] = str(e)
 
+            # Headers are already on the wire; let the server close the connection
+            if response_started:
+                raise
+
             # Return 500 error response
-            return JSONResponse(
+            response = ORJSONResponse(
                 status_code=500,
                 content=error_response
             )
+            await response(scope, receive, send)
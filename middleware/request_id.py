@@ -12,22 +12,23 @@ workers and need to trace a specific request through all components.
 """
 
 import logging
-import uuid
-from typing import Callable
+import os
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.structured_logging import bound_context
 
 logger = logging.getLogger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware that adds a unique request ID to each request.
 
     The request ID is:
     1. Extracted from X-Request-ID header if provided by client
-    2. Generated as UUID if not provided
+    2. Generated as 32 random hex chars if not provided (same length as a
+       W3C traceparent trace-id, so it can be reused there unchanged)
     3. Stored in request.state.request_id for use by other middleware
     4. Added to response headers as X-Request-ID
 
@@ -35,34 +36,61 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     for easy correlation and troubleshooting.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, bind_structlog: bool = True):
         """
-        Process request and inject request ID
+        Initialize request ID middleware
 
         Args:
-            request: Incoming FastAPI request
-            call_next: Next middleware/route handler
+            app: ASGI application
+            bind_structlog: Bind request_id into the structlog context for the
+                duration of the request (skip when structlog is not used)
+        """
+        self.app = app
+        self.bind_structlog = bind_structlog
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and inject request ID
 
-        Returns:
-            Response with X-Request-ID header
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Extract or generate request ID
-        request_id = request.headers.get("x-request-id")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Extract or generate request ID. Header names in the scope are already
+        # lowercased bytes, so scan them directly instead of building Headers.
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
 
         if not request_id:
-            # Generate new UUID for this request
-            request_id = str(uuid.uuid4())
+            # Generate new random ID for this request (no UUID object/formatting)
+            request_id = os.urandom(16).hex()
             logger.debug("Generated new request ID: %s", request_id)
         else:
             logger.debug("Using client-provided request ID: %s", request_id)
 
         # Store in request state for access by other middleware and handlers
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
 
-        # Process request
-        response = await call_next(request)
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add request ID to response headers for client correlation
+                message.setdefault("headers", []).append(request_id_header)
+            await send(message)
 
-        # Add request ID to response headers for client correlation
-        response.headers["X-Request-ID"] = request_id
+        if not self.bind_structlog:
+            await self.app(scope, receive, send_with_request_id)
+            return
 
-        return response
+        # Bind for structlog loggers; the previous context is restored afterwards
+        with bound_context(request_id=request_id):
+            await self.app(scope, receive, send_with_request_id)
@@ -4,13 +4,28 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Type
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+from .error_simulator import utc_timestamp
+
+# Messages for ?simulate_error=<code> (read-only, shared by all mock servers)
+SIMULATED_ERROR_MESSAGES = MappingProxyType({
+    400: "Bad Request - simulated error",
+    401: "Unauthorized - simulated error",
+    403: "Forbidden - simulated error",
+    404: "Not Found - simulated error",
+    500: "Internal Server Error - simulated error",
+    502: "Bad Gateway - simulated error",
+    503: "Service Unavailable - simulated error",
+})
+
 
 class MockConfig(BaseSettings):
     """
@@ -22,6 +37,10 @@ class MockConfig(BaseSettings):
     - MOCK_LOG_LEVEL: Logging level
     - MOCK_RESPONSE_DELAY_MS: Artificial delay in milliseconds
     - MOCK_ERROR_RATE: Random error rate (0.0 to 1.0)
+    - MOCK_RETENTION: Max stored messages/events kept in memory per store
+    - MOCK_LOOP: uvicorn event loop (uvloop, asyncio, auto)
+    - MOCK_HTTP: uvicorn HTTP parser (httptools, h11, auto)
+    - MOCK_WORKERS: uvicorn worker processes (needs an app factory, state is per worker)
     """
 
     host: str = "0.0.0.0"
@@ -30,6 +49,12 @@ class MockConfig(BaseSettings):
     enable_cors: bool = True
     response_delay_ms: int = 0
     error_rate: float = 0.0
+    retention: int = 10_000
+    # Explicit so a missing uvicorn[standard] install fails loudly instead of
+    # silently falling back to asyncio/h11
+    loop: str = "uvloop"
+    http: str = "httptools"
+    workers: int = 1
 
     class Config:
         env_prefix = "MOCK_"
@@ -56,7 +81,7 @@ class BaseMockServer(ABC):
     Abstract base class for all mock servers
 
     Provides:
-    - Standard FastAPI app configuration
+    - Standard FastAPI app configuration (ORJSONResponse by default)
     - CORS middleware
     - Health check endpoint
     - Error simulation support
@@ -84,7 +109,8 @@ class BaseMockServer(ABC):
         title: str,
         description: str,
         version: str = "1.0.0",
-        config: Optional[MockConfig] = None
+        config: Optional[MockConfig] = None,
+        default_response_class: Type[Response] = ORJSONResponse
     ):
         """
         Initialize base mock server
@@ -94,6 +120,7 @@ class BaseMockServer(ABC):
             description: API description
             version: API version
             config: Optional custom configuration
+            default_response_class: Response class for routes (orjson-encoded by default)
         """
         self.config = config or MockConfig()
         self.title = title
@@ -110,7 +137,8 @@ class BaseMockServer(ABC):
             version=version,
             docs_url="/docs",
             redoc_url="/redoc",
-            openapi_url="/openapi.json"
+            openapi_url="/openapi.json",
+            default_response_class=default_response_class
         )
 
         # Add CORS middleware
@@ -187,24 +215,15 @@ class BaseMockServer(ABC):
         """
         if simulate_error:
             self.logger.warning("Simulating error: HTTP %d", simulate_error)
-            error_messages = {
-                400: "Bad Request - simulated error",
-                401: "Unauthorized - simulated error",
-                403: "Forbidden - simulated error",
-                404: "Not Found - simulated error",
-                500: "Internal Server Error - simulated error",
-                502: "Bad Gateway - simulated error",
-                503: "Service Unavailable - simulated error",
-            }
             raise HTTPException(
                 status_code=simulate_error,
                 detail={
                     "error": f"simulated_error_{simulate_error}",
-                    "message": error_messages.get(
+                    "message": SIMULATED_ERROR_MESSAGES.get(
                         simulate_error,
                         f"Simulated error {simulate_error}"
                     ),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_timestamp()
                 }
             )
 
@@ -217,18 +236,27 @@ class BaseMockServer(ABC):
         """
         pass
 
-    def run(self, host: Optional[str] = None, port: Optional[int] = None):
+    def run(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        app_factory: Optional[str] = None
+    ):
         """
         Run the mock server
 
         Args:
             host: Override configured host
             port: Override configured port
+            app_factory: Import string of a zero-argument app factory
+                ("module:function"); required for MOCK_WORKERS > 1 since each
+                worker process builds its own app
         """
         import uvicorn
 
         run_host = host or self.config.host
         run_port = port or self.config.port
+        workers = self.config.workers if app_factory else 1
 
         self.logger.info(
             "Starting %s on http://%s:%d",
@@ -237,10 +265,20 @@ class BaseMockServer(ABC):
             run_port
         )
         self.logger.info("OpenAPI docs: http://%s:%d/docs", run_host, run_port)
+        self.logger.info("Event loop: %s, HTTP parser: %s", self.config.loop, self.config.http)
+
+        if self.config.workers > 1 and not app_factory:
+            self.logger.warning("MOCK_WORKERS ignored: %s has no app factory", self.title)
+        if workers > 1:
+            self.logger.info("Workers: %d (in-memory state is per worker)", workers)
 
         uvicorn.run(
-            self.app,
+            app_factory if workers > 1 else self.app,
+            factory=workers > 1,
+            workers=workers,
             host=run_host,
             port=run_port,
-            log_level=self.config.log_level.lower()
+            log_level=self.config.log_level.lower(),
+            loop=self.config.loop,
+            http=self.config.http
         )
@@ -2,12 +2,21 @@
 # Configurable error simulation for testing error handling
 
 import random
-from datetime import datetime
+import time
 from typing import Dict, Optional
 
 from fastapi import HTTPException
 
 
+def utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with second precision (e.g. 2024-01-20T10:00:00Z)"""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _no_error():
+    """maybe_raise_error implementation used when error_rate is 0"""
+
+
 class ErrorSimulator:
     """
     Simulate various error conditions for testing
@@ -35,6 +44,22 @@ class ErrorSimulator:
         """
         self.error_rate = error_rate
 
+    @property
+    def error_rate(self) -> float:
+        """Probability of random error (0.0 to 1.0)"""
+        return self._error_rate
+
+    @error_rate.setter
+    def error_rate(self, value: float):
+        self._error_rate = value
+
+        # Specialize maybe_raise_error once: with no error rate it becomes a
+        # plain no-op, so per-request calls skip the RNG and attribute reads
+        if value > 0:
+            self.__dict__.pop("maybe_raise_error", None)
+        else:
+            self.maybe_raise_error = _no_error
+
     def maybe_raise_error(self):
         """
         Randomly raise an error based on configured error_rate
@@ -42,7 +67,7 @@ class ErrorSimulator:
         Raises:
             HTTPException: Random 5xx error if triggered
         """
-        if self.error_rate > 0 and random.random() < self.error_rate:
+        if random.random() < self._error_rate:
             error_code = random.choice([500, 502, 503])
             raise HTTPException(
                 status_code=error_code,
@@ -235,7 +260,7 @@ class ErrorSimulator:
         detail = {
             "error": error,
             "message": message,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_timestamp(),
         }
 
         if details:
@@ -3,16 +3,17 @@
 
 import asyncio
 import logging
+import queue
 import time
-from typing import Callable
-
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from logging.handlers import QueueHandler, QueueListener
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Log all incoming requests and responses
 
@@ -20,39 +21,78 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - Request method, path, query params
     - Response status code
     - Request duration
+
+    Pure ASGI middleware: the status code is captured by wrapping ``send``.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details"""
-        start_time = time.time()
+        # Quiet mocks (log level above INFO) skip timing and formatting entirely;
+        # isEnabledFor() is answered from the logging module's level cache
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        query_string = scope.get("query_string", b"")
 
         # Log incoming request
         logger.info(
             "Request: %s %s %s",
-            request.method,
-            request.url.path,
-            f"?{request.url.query}" if request.url.query else ""
+            method,
+            path,
+            f"?{query_string.decode('latin-1')}" if query_string else ""
         )
 
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         # Process request
-        response = await call_next(request)
+        await self.app(scope, receive, send_wrapper)
 
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Log response
         logger.info(
             "Response: %s %s - Status: %d - Duration: %.3fs",
-            request.method,
-            request.url.path,
-            response.status_code,
+            method,
+            path,
+            status_code,
             duration
         )
 
-        return response
+
+def _parse_delay(query_string: bytes, default: int) -> int:
+    """
+    Read ``delay_ms`` from a raw query string in a single scan
+
+    Returns ``default`` when the parameter is absent or not a non-negative
+    integer.
+    """
+    i = query_string.find(b"delay_ms=")
+    # Must start a parameter, not be the tail of another name (e.g. max_delay_ms)
+    while i > 0 and query_string[i - 1] != 0x26:  # b"&"
+        i = query_string.find(b"delay_ms=", i + 9)
+    if i < 0:
+        return default
+
+    j = query_string.find(b"&", i + 9)
+    value = query_string[i + 9:j] if j >= 0 else query_string[i + 9:]
+    return int(value) if value.isdigit() else default
 
 
-class ResponseDelayMiddleware(BaseHTTPMiddleware):
+class ResponseDelayMiddleware:
     """
     Add artificial delay to responses for network simulation
 
@@ -61,40 +101,92 @@ class ResponseDelayMiddleware(BaseHTTPMiddleware):
     - Per-request delay via query parameter (?delay_ms=1000)
     """
 
-    def __init__(self, app: FastAPI, default_delay_ms: int = 0):
+    def __init__(self, app: ASGIApp, default_delay_ms: int = 0):
         """
         Initialize delay middleware
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             default_delay_ms: Default delay in milliseconds
         """
-        super().__init__(app)
+        self.app = app
         self.default_delay_ms = default_delay_ms
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with delay"""
-        # Check for per-request delay parameter
-        delay_ms = request.query_params.get("delay_ms", self.default_delay_ms)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        try:
-            delay_ms = int(delay_ms)
-        except (ValueError, TypeError):
-            delay_ms = self.default_delay_ms
+        query_string = scope.get("query_string", b"")
+
+        # Nothing to do without a global delay or a per-request parameter
+        if not self.default_delay_ms and b"delay_ms" not in query_string:
+            await self.app(scope, receive, send)
+            return
+
+        # Check for per-request delay parameter
+        delay_ms = _parse_delay(query_string, self.default_delay_ms)
 
         # Apply delay before processing request
         if delay_ms > 0:
             logger.debug("Simulating network delay: %dms", delay_ms)
             await asyncio.sleep(delay_ms / 1000.0)
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues the record untouched.
+
+    The stock prepare() formats the message and traceback in the calling
+    thread; records stay in-process here, so formatting is left to the
+    listener thread along with the I/O. Mirrors the API's handler in
+    config/logging_config.py, which the standalone mock image cannot import.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _queue_middleware_logging(app: FastAPI):
+    """
+    Route this module's log records through a queue drained by a background thread
+
+    Records emitted by the middlewares are handed to the root logger's handlers
+    by a QueueListener, so the request path only enqueues; formatting happens on
+    the listener thread. The listener is stopped (and flushed) on app shutdown.
+    """
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
+        return
+
+    handlers = logging.getLogger().handlers
+    if not handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    queue_handler = _DeferredQueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+
+    def stop_listener():
+        listener.stop()
+        logger.removeHandler(queue_handler)
+        logger.propagate = True
+
+    listener.start()
+    app.add_event_handler("shutdown", stop_listener)
 
 
 def add_mock_middleware(
     app: FastAPI,
     enable_logging: bool = True,
     enable_delay: bool = True,
-    default_delay_ms: int = 0
+    default_delay_ms: int = 0,
+    enable_gzip: bool = True
 ):
     """
     Add standard middleware to mock server
@@ -104,8 +196,15 @@ def add_mock_middleware(
         enable_logging: Enable request/response logging
         enable_delay: Enable response delay simulation
         default_delay_ms: Default delay in milliseconds
+        enable_gzip: Gzip responses over 1 KB for clients that accept it
     """
+    # Added first so it sits innermost: logging and delay see the final response
+    if enable_gzip:
+        app.add_middleware(GZipMiddleware, minimum_size=1024)
+        logger.info("GZip compression middleware enabled (minimum size: 1024 bytes)")
+
     if enable_logging:
+        _queue_middleware_logging(app)
         app.add_middleware(RequestLoggingMiddleware)
         logger.info("Request logging middleware enabled")
 
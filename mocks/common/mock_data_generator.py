@@ -2,12 +2,60 @@
 # Realistic mock data generation using Faker
 
 import random
+import time
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from faker import Faker
 
+# Number of pre-generated values per Faker field
+POOL_SIZE = 1024
+
+GROUP_TYPES = ("hiking", "photography", "cooking", "gaming", "reading", "music")
+_BOOLS = (True, False)
+_ACTIVE_WEIGHTS = (True, True, True, False)
+_VERIFIED_WEIGHTS = (True, True, False)
+
+_DAY = 86400
+_HOUR = 3600
+
+
+@lru_cache(maxsize=4096)
+def _iso_second(second: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+
+
+def _iso_z(ts: float) -> str:
+    """
+    Format a Unix timestamp as ISO 8601 UTC with second precision
+
+    Batch rows are offsets of whole days from one base time, so only a few
+    hundred distinct seconds occur and the formatted strings are memoized.
+    """
+    return _iso_second(int(ts))
+
+
+@lru_cache(maxsize=None)
+def _faker_pools(locale: str, seed: Optional[int]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Pre-generate pools of Faker values once per (locale, seed)
+
+    Faker provider dispatch costs tens of microseconds per call; generated
+    records sample from these pools instead. Must be called after seeding so
+    seeded generators get reproducible pools.
+    """
+    fake = Faker(locale)
+    return {
+        "first_names": tuple(fake.first_name() for _ in range(POOL_SIZE)),
+        "last_names": tuple(fake.last_name() for _ in range(POOL_SIZE)),
+        "usernames": tuple(fake.user_name() for _ in range(POOL_SIZE)),
+        "phones": tuple(fake.phone_number() for _ in range(POOL_SIZE)),
+        "bios": tuple(fake.text(max_nb_chars=200) for _ in range(POOL_SIZE)),
+        "catch_phrases": tuple(fake.catch_phrase() for _ in range(POOL_SIZE)),
+        "paragraphs": tuple(fake.paragraph(nb_sentences=3) for _ in range(POOL_SIZE)),
+    }
+
 
 class MockDataGenerator:
     """
@@ -39,6 +87,17 @@ class MockDataGenerator:
             Faker.seed(seed)
             random.seed(seed)
 
+        pools = _faker_pools(locale, seed)
+        self._first_names = pools["first_names"]
+        self._last_names = pools["last_names"]
+        self._usernames = pools["usernames"]
+        self._phones = pools["phones"]
+        self._bios = pools["bios"]
+        self._catch_phrases = pools["catch_phrases"]
+        self._paragraphs = pools["paragraphs"]
+
+        self._make_user = self._user_builder()
+
     def generate_uuid(self) -> str:
         """Generate a UUID v4"""
         return str(uuid.uuid4())
@@ -60,16 +119,11 @@ class MockDataGenerator:
         Returns:
             ISO 8601 formatted timestamp
         """
-        now = datetime.utcnow()
+        now = time.time()
 
         if future:
-            delta = timedelta(days=random.randint(1, 30))
-            timestamp = now + delta
-        else:
-            delta = timedelta(days=days_ago, hours=hours_ago)
-            timestamp = now - delta
-
-        return timestamp.isoformat() + "Z"
+            return _iso_z(now + random.randint(1, 30) * _DAY)
+        return _iso_z(now - days_ago * _DAY - hours_ago * _HOUR)
 
     def generate_user(
         self,
@@ -86,25 +140,51 @@ class MockDataGenerator:
         Returns:
             Dict with user data
         """
-        user_id = user_id or self.generate_uuid()
-        first_name = self.fake.first_name()
-        last_name = self.fake.last_name()
+        return self._make_user(user_id, email, time.time())
 
-        return {
-            "id": user_id,
-            "email": email or self.fake.email(),
-            "first_name": first_name,
-            "last_name": last_name,
-            "full_name": f"{first_name} {last_name}",
-            "username": self.fake.user_name(),
-            "phone": self.fake.phone_number(),
-            "avatar_url": f"https://api.dicebear.com/7.x/avataaars/svg?seed={user_id}",
-            "bio": self.fake.text(max_nb_chars=200),
-            "created_at": self.generate_timestamp(days_ago=random.randint(30, 365)),
-            "updated_at": self.generate_timestamp(days_ago=random.randint(0, 30)),
-            "is_active": random.choice([True, True, True, False]),  # 75% active
-            "email_verified": random.choice([True, True, False]),  # 66% verified
-        }
+    def _user_builder(self):
+        """
+        Specialize the user-dict builder for this instance
+
+        Pools, the Faker email provider and module helpers are captured as
+        closure variables, so the per-user hot path does no attribute lookups
+        on ``self``. Plain closure rather than exec'd source: same effect,
+        and it stays readable and debuggable.
+        """
+        first_names = self._first_names
+        last_names = self._last_names
+        usernames = self._usernames
+        phones = self._phones
+        bios = self._bios
+        fake_email = self.fake.email
+        uuid4 = uuid.uuid4
+        choice = random.choice
+        randint = random.randint
+        iso_z = _iso_z
+
+        def make_user(user_id: Optional[str], email: Optional[str], now: float) -> Dict:
+            """Build a user dict relative to a shared ``now`` (hot path for batches)"""
+            user_id = user_id or str(uuid4())
+            first_name = choice(first_names)
+            last_name = choice(last_names)
+
+            return {
+                "id": user_id,
+                "email": email or fake_email(),
+                "first_name": first_name,
+                "last_name": last_name,
+                "full_name": f"{first_name} {last_name}",
+                "username": choice(usernames),
+                "phone": choice(phones),
+                "avatar_url": f"https://api.dicebear.com/7.x/avataaars/svg?seed={user_id}",
+                "bio": choice(bios),
+                "created_at": iso_z(now - randint(30, 365) * _DAY),
+                "updated_at": iso_z(now - randint(0, 30) * _DAY),
+                "is_active": choice(_ACTIVE_WEIGHTS),  # 75% active
+                "email_verified": choice(_VERIFIED_WEIGHTS),  # 66% verified
+            }
+
+        return make_user
 
     def generate_group(
         self,
@@ -121,26 +201,37 @@ class MockDataGenerator:
         Returns:
             Dict with group data
         """
-        group_id = group_id or self.generate_uuid()
-        member_count = member_count or random.randint(5, 100)
+        return self._make_group(group_id, member_count, time.time())
 
-        group_types = ["hiking", "photography", "cooking", "gaming", "reading", "music"]
-        group_type = random.choice(group_types)
+    def _make_group(
+        self,
+        group_id: Optional[str],
+        member_count: Optional[int],
+        now: float,
+        _uuid4=uuid.uuid4,
+        _choice=random.choice,
+        _randint=random.randint,
+        _iso_z=_iso_z,
+    ) -> Dict:
+        """Build a group dict relative to a shared ``now`` (hot path for batches)"""
+        group_id = group_id or str(_uuid4())
+        member_count = member_count or _randint(5, 100)
+        group_type = _choice(GROUP_TYPES)
 
         return {
             "id": group_id,
-            "name": f"{self.fake.catch_phrase()} {group_type.title()} Club",
-            "description": self.fake.paragraph(nb_sentences=3),
+            "name": f"{_choice(self._catch_phrases)} {group_type.title()} Club",
+            "description": _choice(self._paragraphs),
             "type": group_type,
             "member_count": member_count,
-            "is_public": random.choice([True, False]),
-            "created_at": self.generate_timestamp(days_ago=random.randint(60, 730)),
-            "updated_at": self.generate_timestamp(days_ago=random.randint(0, 60)),
+            "is_public": _choice(_BOOLS),
+            "created_at": _iso_z(now - _randint(60, 730) * _DAY),
+            "updated_at": _iso_z(now - _randint(0, 60) * _DAY),
             "avatar_url": f"https://api.dicebear.com/7.x/identicon/svg?seed={group_id}",
-            "creator_id": self.generate_uuid(),
+            "creator_id": str(_uuid4()),
             "settings": {
                 "allow_invites": True,
-                "require_approval": random.choice([True, False]),
+                "require_approval": _choice(_BOOLS),
                 "email_notifications": True,
             }
         }
@@ -184,7 +275,7 @@ class MockDataGenerator:
         Returns:
             Email address string
         """
-        username = self.fake.user_name()
+        username = random.choice(self._usernames)
         return f"{username}@{domain}"
 
     def generate_batch_users(self, count: int = 10) -> List[Dict]:
@@ -197,7 +288,9 @@ class MockDataGenerator:
         Returns:
             List of user dicts
         """
-        return [self.generate_user() for _ in range(count)]
+        make_user = self._make_user
+        now = time.time()
+        return [make_user(None, None, now) for _ in range(count)]
 
     def generate_batch_groups(self, count: int = 5) -> List[Dict]:
         """
@@ -209,7 +302,9 @@ class MockDataGenerator:
         Returns:
             List of group dicts
         """
-        return [self.generate_group() for _ in range(count)]
+        make_group = self._make_group
+        now = time.time()
+        return [make_group(None, None, now) for _ in range(count)]
 
     def generate_api_response(
         self,
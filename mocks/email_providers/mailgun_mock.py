@@ -2,17 +2,22 @@
 # File: mocks/email_providers/mailgun_mock.py
 # Mailgun API Mock Server
 
-import sys
-import uuid
+import base64
+import os
+import re
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Deque, Dict, List, Optional
 
-from fastapi import Depends, Header, HTTPException, status, Form
+from fastapi import Depends, Form, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from starlette.middleware import Middleware
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from common.base_mock import BaseMockServer
 from common.error_simulator import ErrorSimulator
@@ -26,8 +31,9 @@ class MailgunSendResponse(BaseModel):
     message: str = Field("Queued. Thank you.", description="Status message")
 
 
-class MailgunEvent(BaseModel):
-    """Mailgun event"""
+@dataclass(slots=True)
+class MailgunEvent:
+    """Mailgun event (plain dataclass: stored per send, no validation needed)"""
     event: str
     timestamp: float
     id: str
@@ -35,6 +41,83 @@ class MailgunEvent(BaseModel):
     message_id: str
 
 
+class MailgunAuthASGIMiddleware:
+    """
+    Verify Mailgun Basic auth (api:<key>) before routing
+
+    Pure ASGI middleware: the Authorization header is matched byte-for-byte
+    against pre-encoded header values, so no dependency resolution, base64
+    decoding or HTTPException is involved per request. The account name is
+    stored in ``request.state.mailgun_account``. Exempt paths and paths that
+    match no route are passed through unchecked, so unknown paths get the
+    router's 404 rather than a 401.
+    """
+
+    # Endpoints reachable without credentials
+    EXEMPT_PATHS = frozenset({
+        "/health", "/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"
+    })
+
+    _MISSING_BODY = b'{"detail":"Missing Authorization header. Use Basic Auth with api:<key>"}'
+    _INVALID_BODY = b'{"detail":"Invalid API key"}'
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        valid_auth_headers: Dict[bytes, str],
+        routes: List[BaseRoute],
+    ):
+        self.app = app
+        self.valid_auth_headers = valid_auth_headers
+        # Starlette builds the middleware stack on the first request, after
+        # every route is registered, so one combined regex can stand in for
+        # a routing pass. Group names are dropped as they repeat across routes.
+        self._protected_path = re.compile("|".join(
+            re.sub(r"\(\?P<\w+>", "(?:", route.path_regex.pattern)
+            for route in routes
+            if getattr(route, "path_regex", None) and route.path not in self.EXEMPT_PATHS
+        ))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # CORS preflight requests carry no credentials
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not self._protected_path.match(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+
+        account = self.valid_auth_headers.get(authorization) if authorization else None
+        if account is None:
+            await self._reject(
+                send,
+                self._MISSING_BODY if authorization is None else self._INVALID_BODY
+            )
+            return
+
+        scope.setdefault("state", {})["mailgun_account"] = account
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send: Send, body: bytes) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
 class MailgunAPIMock(BaseMockServer):
     """
     Mock server for Mailgun Email API
@@ -55,6 +138,9 @@ class MailgunAPIMock(BaseMockServer):
     - Full OpenAPI documentation at /docs
     """
 
+    # /{domain}/events has no real paging
+    _EMPTY_PAGING = {"next": None, "previous": None}
+
     def __init__(self):
         """Initialize Mailgun API mock server"""
         super().__init__(
@@ -67,9 +153,17 @@ class MailgunAPIMock(BaseMockServer):
         self.data_generator = MockDataGenerator(seed=200)
         self.error_simulator = ErrorSimulator()
 
-        # In-memory storage
-        self.sent_messages: Dict[str, Dict] = {}
-        self.events: List[MailgunEvent] = []
+        # In-memory storage, bounded to the newest MOCK_RETENTION entries
+        self.retention = self.config.retention
+        self.sent_messages: "OrderedDict[str, Dict]" = OrderedDict()
+        # Events indexed by sending domain for /{domain}/events
+        self.events_by_domain: Dict[str, Deque[MailgunEvent]] = defaultdict(
+            partial(deque, maxlen=self.retention)
+        )
+
+        # Random bytes for message/event IDs, refilled in bulk by _cheap_hex
+        self._rand_buf = b""
+        self._rand_pos = 0
 
         # Valid API keys (format: "api:<key>")
         self.valid_api_keys = {
@@ -77,14 +171,42 @@ class MailgunAPIMock(BaseMockServer):
             "api:mock-mailgun-key-abcde": "mock-account"
         }
 
-        # Valid domains
-        self.valid_domains = [
+        # Accepted Authorization header values, encoded once
+        self._valid_auth_headers = {
+            b"Basic " + base64.b64encode(key.encode()): account
+            for key, account in self.valid_api_keys.items()
+        }
+
+        # Valid domains (list keeps /v3/domains ordering, set is for lookups)
+        self.valid_domains_list = [
             "sandbox123.mailgun.org",
             "mg.example.com",
             "mail.freeface.com"
         ]
+        self.valid_domains = frozenset(self.valid_domains_list)
+
+        # /v3/domains body is static, so render it once
+        self._domains_response = {
+            "total_count": len(self.valid_domains_list),
+            "items": [
+                {
+                    "name": domain,
+                    "state": "active",
+                    "created_at": self.data_generator.generate_timestamp(days_ago=365),
+                    "type": "sandbox" if "sandbox" in domain else "custom"
+                }
+                for domain in self.valid_domains_list
+            ]
+        }
 
-        # Add middleware
+        # Add middleware. Auth is appended (innermost) rather than added on
+        # top, so the base class's CORS middleware still decorates its 401s
+        # and request logging wraps rejections.
+        self.app.user_middleware.append(Middleware(
+            MailgunAuthASGIMiddleware,
+            valid_auth_headers=self._valid_auth_headers,
+            routes=self.app.router.routes
+        ))
         add_mock_middleware(self.app, enable_logging=True, enable_delay=True)
 
         # Setup routes
@@ -92,59 +214,30 @@ class MailgunAPIMock(BaseMockServer):
 
         self.logger.info("Mailgun API mock initialized")
 
-    def _verify_api_key(self, authorization: Optional[str] = Header(None)) -> str:
-        """
-        Verify Mailgun API key (Basic Auth)
-
-        Args:
-            authorization: Basic auth from Authorization header
-
-        Returns:
-            Account name if valid
+    def _store(self, message_id: str, message_data: Dict):
+        """Store a sent message, evicting the oldest beyond retention"""
+        self.sent_messages[message_id] = message_data
+        if len(self.sent_messages) > self.retention:
+            self.sent_messages.popitem(last=False)
 
-        Raises:
-            HTTPException: If API key is invalid
+    def _cheap_hex(self, n: int = 16) -> str:
         """
-        if not authorization:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Missing Authorization header. Use Basic Auth with api:<key>"
-            )
-
-        # Mailgun uses Basic auth with "api" as username
-        import base64
-
-        if not authorization.startswith("Basic "):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Use Basic Auth with api:<key>"
-            )
+        Return ``n`` random bytes as hex, sliced from a bulk os.urandom buffer
 
-        try:
-            encoded = authorization.replace("Basic ", "")
-            decoded = base64.b64decode(encoded).decode("utf-8")
-
-            if decoded not in self.valid_api_keys:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid API key"
-                )
-
-            account = self.valid_api_keys[decoded]
-            self.logger.debug("API key verified for account: %s", account)
-            return account
-
-        except Exception as e:
-            self.logger.warning("Auth error: %s", e)
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
-            )
+        Mock IDs only need to be unique within a run, so one urandom call
+        serves hundreds of IDs.
+        """
+        pos = self._rand_pos
+        if pos + n > len(self._rand_buf):
+            self._rand_buf = os.urandom(4096)
+            pos = 0
+        self._rand_pos = pos + n
+        return self._rand_buf[pos:pos + n].hex()
 
     def _setup_routes(self):
         """Setup API routes"""
 
-        @self.app.post("/{domain}/messages", response_model=MailgunSendResponse)
+        @self.app.post("/{domain}/messages", responses={200: {"model": MailgunSendResponse}})
         async def send_email(
             domain: str,
             from_: str = Form(..., alias="from"),
@@ -152,7 +245,6 @@ class MailgunAPIMock(BaseMockServer):
             subject: str = Form(...),
             text: Optional[str] = Form(None),
             html: Optional[str] = Form(None),
-            account: str = Depends(self._verify_api_key),
             _error_check=Depends(self.check_error_simulation)
         ):
             """
@@ -181,7 +273,9 @@ class MailgunAPIMock(BaseMockServer):
                 self.error_simulator.raise_not_found("domain", domain)
 
             # Generate message ID
-            message_id = f"<{uuid.uuid4().hex}@{domain}>"
+            message_id = f"<{self._cheap_hex()}@{domain}>"
+            now_ts = time.time()
+            now_iso = datetime.utcfromtimestamp(now_ts).isoformat(timespec="milliseconds") + "Z"
 
             # Store message
             message_data = {
@@ -191,32 +285,28 @@ class MailgunAPIMock(BaseMockServer):
                 "to": to,
                 "subject": subject,
                 "status": "queued",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": now_iso,
             }
 
-            self.sent_messages[message_id] = message_data
+            self._store(message_id, message_data)
 
             # Generate event
             event = MailgunEvent(
                 event="accepted",
-                timestamp=datetime.utcnow().timestamp(),
-                id=f"evt_{uuid.uuid4().hex[:16]}",
+                timestamp=now_ts,
+                id=f"evt_{self._cheap_hex(8)}",
                 recipient=to,
                 message_id=message_id
             )
-            self.events.append(event)
+            self.events_by_domain[domain].append(event)
 
             self.logger.info("Email queued: %s", message_id)
 
-            return MailgunSendResponse(
-                id=message_id,
-                message="Queued. Thank you."
-            )
+            return ORJSONResponse({"id": message_id, "message": "Queued. Thank you."})
 
         @self.app.get("/{domain}/events")
         async def get_events(
             domain: str,
-            account: str = Depends(self._verify_api_key),
             _error_check=Depends(self.check_error_simulation)
         ):
             """
@@ -226,23 +316,16 @@ class MailgunAPIMock(BaseMockServer):
             """
             self.logger.info("Get events for domain: %s", domain)
 
-            # Filter events by domain
-            domain_events = [
-                event for event in self.events
-                if event.message_id.endswith(f"@{domain}>")
-            ]
-
-            return {
-                "items": [event.model_dump() for event in domain_events],
-                "paging": {
-                    "next": None,
-                    "previous": None
-                }
-            }
+            # Returned as a response directly so FastAPI's jsonable_encoder is
+            # skipped; orjson serializes the event dataclasses natively
+            return ORJSONResponse({
+                "items": list(self.events_by_domain.get(domain, ())),
+                "paging": self._EMPTY_PAGING
+            })
 
         @self.app.get("/v3/domains")
         async def list_domains(
-            account: str = Depends(self._verify_api_key),
+            request: Request,
             _error_check=Depends(self.check_error_simulation)
         ):
             """
@@ -250,22 +333,17 @@ class MailgunAPIMock(BaseMockServer):
 
             **Authentication:** Basic Auth with api:<key>
             """
-            self.logger.info("List domains for account: %s", account)
+            self.logger.info(
+                "List domains for account: %s",
+                request.state.mailgun_account
+            )
 
-            domains = [
-                {
-                    "name": domain,
-                    "state": "active",
-                    "created_at": self.data_generator.generate_timestamp(days_ago=365),
-                    "type": "sandbox" if "sandbox" in domain else "custom"
-                }
-                for domain in self.valid_domains
-            ]
+            return self._domains_response
 
-            return {
-                "total_count": len(domains),
-                "items": domains
-            }
+
+def create_app():
+    """App factory used by each uvicorn worker when MOCK_WORKERS > 1"""
+    return MailgunAPIMock().app
 
 
 def main():
@@ -277,7 +355,7 @@ def main():
     # Allow port override via environment
     port = int(os.getenv("MOCK_PORT", "8003"))
 
-    mock.run(port=port)
+    mock.run(port=port, app_factory="email_providers.mailgun_mock:create_app")
 
 
 if __name__ == "__main__":
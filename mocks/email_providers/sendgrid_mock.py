@@ -2,17 +2,19 @@
 # File: mocks/email_providers/sendgrid_mock.py
 # SendGrid API Mock Server
 
-import sys
-import uuid
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
-
-from fastapi import Depends, Header, HTTPException, status
-from pydantic import BaseModel, EmailStr, Field
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import hashlib
+import logging
+import secrets
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
 
 from common.base_mock import BaseMockServer
 from common.error_simulator import ErrorSimulator
@@ -20,21 +22,37 @@ from common.middleware import add_mock_middleware
 from common.mock_data_generator import MockDataGenerator
 
 
+# Request models are validated once and never mutated
+_REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 # Pydantic Models for SendGrid API
 class EmailAddress(BaseModel):
     """Email address model"""
-    email: EmailStr
+    model_config = _REQUEST_MODEL_CONFIG
+    email: str = Field(..., json_schema_extra={"format": "email"})
     name: Optional[str] = None
 
+    @field_validator("email")
+    @classmethod
+    def _check_email(cls, value: str) -> str:
+        # A mock only needs to reject obvious garbage; full RFC 5322 parsing
+        # via email-validator costs tens of microseconds per recipient
+        if "@" not in value:
+            raise ValueError("value is not a valid email address")
+        return value
+
 
 class EmailContent(BaseModel):
     """Email content model"""
+    model_config = _REQUEST_MODEL_CONFIG
     type: str = Field(..., description="Content type (text/plain, text/html)")
     value: str = Field(..., description="Content value")
 
 
 class Personalization(BaseModel):
     """Email personalization"""
+    model_config = _REQUEST_MODEL_CONFIG
     to: List[EmailAddress] = Field(..., description="Recipients")
     cc: Optional[List[EmailAddress]] = None
     bcc: Optional[List[EmailAddress]] = None
@@ -44,6 +62,7 @@ class Personalization(BaseModel):
 
 class SendEmailRequest(BaseModel):
     """SendGrid send email request"""
+    model_config = _REQUEST_MODEL_CONFIG
     personalizations: List[Personalization] = Field(..., description="Personalizations")
     from_: EmailAddress = Field(..., alias="from", description="Sender")
     subject: str = Field(..., description="Email subject")
@@ -51,6 +70,10 @@ class SendEmailRequest(BaseModel):
     reply_to: Optional[EmailAddress] = None
 
 
+# Built once at import; validates raw JSON bytes for /v3/mail/send
+SEND_EMAIL_ADAPTER = TypeAdapter(SendEmailRequest)
+
+
 class SendEmailResponse(BaseModel):
     """SendGrid send email response"""
     message_id: str = Field(..., description="Message ID")
@@ -64,7 +87,7 @@ class EmailStats(BaseModel):
 
 
 class WebhookEvent(BaseModel):
-    """SendGrid webhook event"""
+    """SendGrid webhook event (documents the dicts stored by the mock)"""
     email: str
     timestamp: int
     event: str
@@ -73,6 +96,61 @@ class WebhookEvent(BaseModel):
     sg_message_id: str
 
 
+@dataclass(slots=True)
+class SentMessage:
+    """Sent message record (plain dataclass: stored per send, no validation needed)"""
+    message_id: str
+    account: str
+    from_: str
+    recipients: Tuple[str, ...]
+    subject: str
+    status: str
+    timestamp: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API representation (``from_`` is exposed as ``from``)"""
+        return {
+            "message_id": self.message_id,
+            "account": self.account,
+            "from": self.from_,
+            "recipients": self.recipients,
+            "subject": self.subject,
+            "status": self.status,
+            "timestamp": self.timestamp,
+        }
+
+
+def _inline_schema(model: type) -> Dict[str, Any]:
+    """JSON schema for ``model`` with $defs references inlined (for openapi_extra)"""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref:
+                return resolve(defs[ref.rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+# /v3/stats body with the date and send-dependent counts left as placeholders:
+# date, bounces, clicks, delivered, opens, processed, requests, unique_clicks,
+# unique_opens
+_STATS_BODY_TEMPLATE = (
+    b'{"stats":[{"date":"%s","stats":[{"metrics":{'
+    b'"blocks":0,"bounce_drops":0,"bounces":%d,"clicks":%d,"deferred":0,'
+    b'"delivered":%d,"invalid_emails":0,"opens":%d,"processed":%d,'
+    b'"requests":%d,"spam_report_drops":0,"spam_reports":0,'
+    b'"unique_clicks":%d,"unique_opens":%d,"unsubscribe_drops":0,'
+    b'"unsubscribes":0}}]}]}'
+)
+
+
 class SendGridAPIMock(BaseMockServer):
     """
     Mock server for SendGrid Email API
@@ -106,9 +184,13 @@ class SendGridAPIMock(BaseMockServer):
         self.data_generator = MockDataGenerator(seed=100)
         self.error_simulator = ErrorSimulator()
 
-        # In-memory storage
-        self.sent_messages: Dict[str, Dict] = {}
-        self.webhook_events: List[WebhookEvent] = []
+        # In-memory storage, messages bounded to the newest MOCK_RETENTION
+        self.retention = self.config.retention
+        self.sent_messages: "OrderedDict[str, SentMessage]" = OrderedDict()
+        self.total_sent = 0
+        # Webhook events stored as plain dicts (WebhookEvent shape) so reads
+        # need no per-event conversion, bounded like the messages
+        self.webhook_events: Deque[Dict] = deque(maxlen=self.retention)
 
         # Valid API keys for testing
         self.valid_api_keys = {
@@ -116,6 +198,15 @@ class SendGridAPIMock(BaseMockServer):
             "SG.mock_key_abcdefghij": "mock-account"
         }
 
+        # Lookups go by SHA-256 digest so the comparison does not leak how
+        # much of a presented key matched
+        self._key_digests = {
+            hashlib.sha256(key.encode()).digest(): account
+            for key, account in self.valid_api_keys.items()
+        }
+
+        self._verify_api_key = self._build_api_key_verifier()
+
         # Add middleware
         add_mock_middleware(self.app, enable_logging=True, enable_delay=True)
 
@@ -124,63 +215,102 @@ class SendGridAPIMock(BaseMockServer):
 
         self.logger.info("SendGrid API mock initialized with %d valid API keys", len(self.valid_api_keys))
 
-    def _verify_api_key(self, authorization: Optional[str] = Header(None)) -> str:
+    def _build_api_key_verifier(self):
         """
-        Verify SendGrid API key
+        Create the API key dependency once per server
 
-        Args:
-            authorization: Bearer token from Authorization header
+        A plain function (not a bound method) gives FastAPI one stable
+        dependency identity, and the digest map and logger are closure
+        variables instead of attribute lookups on every request.
+        """
+        key_digests = self._key_digests
+        logger = self.logger
+        sha256 = hashlib.sha256
 
-        Returns:
-            Account name if valid
+        def verify_api_key(authorization: Optional[str] = Header(None)) -> str:
+            """
+            Verify SendGrid API key
 
-        Raises:
-            HTTPException: If API key is invalid
-        """
-        if not authorization:
-            self.logger.warning("Missing Authorization header")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={
-                    "error": "unauthorized",
-                    "message": "Missing Authorization header. Provide: Authorization: Bearer <api_key>"
-                }
-            )
+            Args:
+                authorization: Bearer token from Authorization header
 
-        # Extract Bearer token
-        if not authorization.startswith("Bearer "):
-            self.logger.warning("Invalid Authorization format")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={
-                    "error": "invalid_auth_format",
-                    "message": "Authorization must be: Bearer <api_key>"
-                }
-            )
+            Returns:
+                Account name if valid
 
-        api_key = authorization.replace("Bearer ", "")
+            Raises:
+                HTTPException: If API key is invalid
+            """
+            if not authorization:
+                logger.warning("Missing Authorization header")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail={
+                        "error": "unauthorized",
+                        "message": (
+                            "Missing Authorization header. "
+                            "Provide: Authorization: Bearer <api_key>"
+                        )
+                    }
+                )
 
-        # Validate API key
-        if api_key not in self.valid_api_keys:
-            self.logger.warning("Invalid API key: %s...", api_key[:10])
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={
-                    "error": "invalid_api_key",
-                    "message": "API key is invalid or expired"
-                }
-            )
+            # Extract Bearer token
+            if not authorization.startswith("Bearer "):
+                logger.warning("Invalid Authorization format")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail={
+                        "error": "invalid_auth_format",
+                        "message": "Authorization must be: Bearer <api_key>"
+                    }
+                )
+
+            api_key = authorization[7:]
+
+            # Validate API key
+            account = key_digests.get(sha256(api_key.encode()).digest())
+            if account is None:
+                logger.warning("Invalid API key: %s...", api_key[:10])
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail={
+                        "error": "invalid_api_key",
+                        "message": "API key is invalid or expired"
+                    }
+                )
 
-        account = self.valid_api_keys[api_key]
-        self.logger.debug("API key verified for account: %s", account)
-        return account
+            logger.debug("API key verified for account: %s", account)
+            return account
+
+        return verify_api_key
+
+    def _store(self, message: SentMessage):
+        """Store a sent message, evicting the oldest beyond retention"""
+        self.sent_messages[message.message_id] = message
+        self.total_sent += 1
+        if len(self.sent_messages) > self.retention:
+            self.sent_messages.popitem(last=False)
 
     def _setup_routes(self):
         """Setup API routes"""
 
-        @self.app.post("/v3/mail/send", response_model=SendEmailResponse, status_code=status.HTTP_202_ACCEPTED)
+        # Routes return ORJSONResponse directly: no response_model revalidation
+        # or jsonable_encoder pass. SendEmailResponse still documents /send.
+        @self.app.post(
+            "/v3/mail/send",
+            status_code=status.HTTP_202_ACCEPTED,
+            responses={status.HTTP_202_ACCEPTED: {"model": SendEmailResponse}},
+            # Body is parsed by the handler; document it explicitly
+            openapi_extra={
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {"schema": _inline_schema(SendEmailRequest)}
+                    }
+                }
+            }
+        )
         async def send_email(
-            request: SendEmailRequest,
+            raw_request: Request,
             account: str = Depends(self._verify_api_key),
             _error_check=Depends(self.check_error_simulation)
         ):
@@ -201,45 +331,61 @@ class SendGridAPIMock(BaseMockServer):
             - SG.test_key_1234567890
             - SG.mock_key_abcdefghij
             """
-            self.logger.info("Send email request from account: %s", account)
+            # One level check covers both hot-path log lines; with
+            # MOCK_LOG_LEVEL=WARNING neither builds its arguments
+            log_info = self.logger.isEnabledFor(logging.INFO)
+            if log_info:
+                self.logger.info("Send email request from account: %s", account)
+
+            # Validate the raw JSON in one pass (no intermediate dict)
+            try:
+                request = SEND_EMAIL_ADAPTER.validate_json(await raw_request.body())
+            except ValidationError as e:
+                # Same 422 shape FastAPI produces for a declared body parameter
+                raise RequestValidationError([
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ])
 
             # Generate message ID
-            message_id = f"msg_{uuid.uuid4().hex}"
+            message_id = "msg_" + secrets.token_hex(16)
 
             # Store message
-            recipients = []
-            for personalization in request.personalizations:
-                recipients.extend([r.email for r in personalization.to])
-
-            message_data = {
-                "message_id": message_id,
-                "account": account,
-                "from": request.from_.email,
-                "recipients": recipients,
-                "subject": request.subject,
-                "status": "queued",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-            }
+            recipients = tuple(
+                recipient.email
+                for personalization in request.personalizations
+                for recipient in personalization.to
+            )
+
+            now = datetime.now(timezone.utc)
 
-            self.sent_messages[message_id] = message_data
+            self._store(SentMessage(
+                message_id=message_id,
+                account=account,
+                from_=request.from_.email,
+                recipients=recipients,
+                subject=request.subject,
+                status="queued",
+                timestamp=f"{now:%Y-%m-%dT%H:%M:%S.%f}Z",
+            ))
 
             # Generate webhook event
             for recipient in recipients[:1]:  # Just first recipient for simplicity
-                event = WebhookEvent(
-                    email=recipient,
-                    timestamp=int(datetime.utcnow().timestamp()),
-                    event="processed",
-                    category=["mock"],
-                    sg_event_id=f"evt_{uuid.uuid4().hex[:16]}",
-                    sg_message_id=message_id
-                )
-                self.webhook_events.append(event)
-
-            self.logger.info("Email queued: %s (%d recipients)", message_id, len(recipients))
-
-            return SendEmailResponse(
-                message_id=message_id,
-                status="queued"
+                self.webhook_events.append({
+                    "email": recipient,
+                    "timestamp": int(now.timestamp()),
+                    "event": "processed",
+                    "category": ["mock"],
+                    "sg_event_id": "evt_" + secrets.token_hex(8),
+                    "sg_message_id": message_id,
+                })
+
+            if log_info:
+                self.logger.info("Email queued: %s (%d recipients)", message_id, len(recipients))
+
+            return ORJSONResponse(
+                content={"message_id": message_id, "status": "queued"},
+                status_code=status.HTTP_202_ACCEPTED
             )
 
         @self.app.get("/v3/stats")
@@ -256,42 +402,23 @@ class SendGridAPIMock(BaseMockServer):
             """
             self.logger.info("Get stats request from account: %s", account)
 
-            # Calculate stats from sent messages
-            total_sent = len(self.sent_messages)
+            # Only the date and send-dependent counts vary, so the body is
+            # formatted straight into pre-encoded JSON
+            total_sent = self.total_sent
             total_delivered = int(total_sent * 0.95)  # 95% delivery rate
-            total_bounced = total_sent - total_delivered
-
-            stats = {
-                "stats": [
-                    {
-                        "date": datetime.utcnow().strftime("%Y-%m-%d"),
-                        "stats": [
-                            {
-                                "metrics": {
-                                    "blocks": 0,
-                                    "bounce_drops": 0,
-                                    "bounces": total_bounced,
-                                    "clicks": int(total_sent * 0.2),
-                                    "deferred": 0,
-                                    "delivered": total_delivered,
-                                    "invalid_emails": 0,
-                                    "opens": int(total_sent * 0.4),
-                                    "processed": total_sent,
-                                    "requests": total_sent,
-                                    "spam_report_drops": 0,
-                                    "spam_reports": 0,
-                                    "unique_clicks": int(total_sent * 0.15),
-                                    "unique_opens": int(total_sent * 0.3),
-                                    "unsubscribe_drops": 0,
-                                    "unsubscribes": 0,
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
 
-            return stats
+            body = _STATS_BODY_TEMPLATE % (
+                datetime.now(timezone.utc).strftime("%Y-%m-%d").encode(),
+                total_sent - total_delivered,
+                int(total_sent * 0.2),
+                total_delivered,
+                int(total_sent * 0.4),
+                total_sent,
+                total_sent,
+                int(total_sent * 0.15),
+                int(total_sent * 0.3),
+            )
+            return Response(body, media_type="application/json")
 
         @self.app.get("/v3/messages")
         async def list_messages(
@@ -307,10 +434,10 @@ class SendGridAPIMock(BaseMockServer):
             """
             self.logger.info("List messages request from account: %s", account)
 
-            return {
-                "messages": list(self.sent_messages.values()),
+            return ORJSONResponse({
+                "messages": [message.to_dict() for message in self.sent_messages.values()],
                 "total": len(self.sent_messages)
-            }
+            })
 
         @self.app.get("/v3/webhooks/events")
         async def get_webhook_events(
@@ -326,10 +453,16 @@ class SendGridAPIMock(BaseMockServer):
             """
             self.logger.info("Get webhook events from account: %s", account)
 
-            return {
-                "events": [event.model_dump() for event in self.webhook_events[-100:]],
-                "total": len(self.webhook_events)
-            }
+            total = len(self.webhook_events)
+            return ORJSONResponse({
+                "events": list(islice(self.webhook_events, max(total - 100, 0), None)),
+                "total": total
+            })
+
+
+def create_app():
+    """App factory used by each uvicorn worker when MOCK_WORKERS > 1"""
+    return SendGridAPIMock().app
 
 
 def main():
@@ -341,7 +474,7 @@ def main():
     # Allow port override via environment
     port = int(os.getenv("MOCK_PORT", "8002"))
 
-    mock.run(port=port)
+    mock.run(port=port, app_factory="email_providers.sendgrid_mock:create_app")
 
 
 if __name__ == "__main__":
@@ -13,10 +13,12 @@ Usage:
 """
 
 import asyncio
+import functools
 import sys
 from pathlib import Path
 
 import httpx
+import orjson
 
 # Configuration
 FREEFACE_API_URL = "http://localhost:8001"
@@ -30,249 +32,295 @@ MAILGUN_API_KEY = "api:test-mailgun-key-12345"
 MAILGUN_DOMAIN = "sandbox123.mailgun.org"
 
 
-async def test_freeface_api():
-    """Test FreeFace API mock"""
-    print("\n=== Testing FreeFace API Mock ===")
-
-    async with httpx.AsyncClient() as client:
-        # Health check
-        print("\n1. Health check...")
-        response = await client.get(f"{FREEFACE_API_URL}/health")
-        print(f"   Status: {response.status_code}")
-        print(f"   Response: {response.json()}")
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-        # List users
-        print("\n2. List users (first page)...")
-        response = await client.get(
-            f"{FREEFACE_API_URL}/api/v1/users",
-            params={"page": 1, "per_page": 5}
-        )
-        print(f"   Status: {response.status_code}")
-        data = response.json()
-        print(f"   Total users: {data['pagination']['total']}")
-        print(f"   Retrieved: {len(data['data'])} users")
-
-        # Get first user ID for subsequent tests
-        user_id = data["data"][0]["id"] if data["data"] else None
-
-        if user_id:
-            # Get specific user
-            print(f"\n3. Get user profile (ID: {user_id[:8]}...)...")
-            response = await client.get(f"{FREEFACE_API_URL}/api/v1/users/{user_id}")
-            print(f"   Status: {response.status_code}")
-            user = response.json()
-            print(f"   User: {user['full_name']} ({user['email']})")
-
-            # Resolve multiple users
-            print("\n4. Resolve multiple users...")
-            response = await client.post(
-                f"{FREEFACE_API_URL}/api/v1/users/resolve",
-                json={"user_ids": [user_id, "nonexistent-id"]}
-            )
-            print(f"   Status: {response.status_code}")
-            result = response.json()
-            print(f"   Found: {len(result['users'])} users")
-            print(f"   Not found: {len(result['not_found'])} users")
-
-        # List groups
-        print("\n5. List groups...")
-        response = await client.get(
-            f"{FREEFACE_API_URL}/api/v1/groups",
-            params={"page": 1, "per_page": 3}
-        )
-        print(f"   Status: {response.status_code}")
-        data = response.json()
-        print(f"   Total groups: {data['pagination']['total']}")
 
-        group_id = data["data"][0]["id"] if data["data"] else None
+def post_json(client: httpx.AsyncClient, url: str, payload, headers=None):
+    """POST ``payload`` encoded with orjson instead of httpx's stdlib json"""
+    return client.post(
+        url,
+        content=orjson.dumps(payload),
+        headers={**JSON_HEADERS, **headers} if headers else JSON_HEADERS
+    )
 
-        if group_id:
-            # Get group members
-            print(f"\n6. Get group members (ID: {group_id[:8]}...)...")
-            response = await client.get(
-                f"{FREEFACE_API_URL}/api/v1/groups/{group_id}/members",
-                params={"page": 1, "per_page": 5}
-            )
-            print(f"   Status: {response.status_code}")
-            data = response.json()
-            print(f"   Total members: {data['pagination']['total']}")
-            print(f"   Retrieved: {len(data['data'])} members")
 
-        # Test error simulation
-        print("\n7. Test error simulation (404)...")
-        response = await client.get(
-            f"{FREEFACE_API_URL}/api/v1/users/invalid-id",
-            params={"simulate_error": 404}
-        )
-        print(f"   Status: {response.status_code} (expected 404)")
+def buffered_output(test):
+    """
+    Collect a suite's output and print it in one block when the suite ends
 
-    print("\n✅ FreeFace API tests completed!")
+    Suites run concurrently, so printing directly would interleave their lines.
+    The wrapped coroutine receives a ``log`` callable in place of print.
+    """
+    @functools.wraps(test)
+    async def wrapper(*args):
+        lines = []
+        try:
+            await test(*args, lines.append)
+        finally:
+            print("\n".join(lines))
 
+    return wrapper
 
-async def test_sendgrid_api():
-    """Test SendGrid API mock"""
-    print("\n=== Testing SendGrid API Mock ===")
-
-    async with httpx.AsyncClient() as client:
-        # Health check
-        print("\n1. Health check...")
-        response = await client.get(f"{SENDGRID_API_URL}/health")
-        print(f"   Status: {response.status_code}")
-
-        # Send email
-        print("\n2. Send email...")
-        response = await client.post(
-            f"{SENDGRID_API_URL}/v3/mail/send",
-            headers={"Authorization": f"Bearer {SENDGRID_API_KEY}"},
-            json={
-                "personalizations": [
-                    {
-                        "to": [{"email": "user@example.com", "name": "Test User"}]
-                    }
-                ],
-                "from": {"email": "sender@freeface.com", "name": "FreeFace"},
-                "subject": "Test Email from Mock",
-                "content": [
-                    {
-                        "type": "text/plain",
-                        "value": "This is a test email from the SendGrid mock!"
-                    }
-                ]
-            }
-        )
-        print(f"   Status: {response.status_code}")
-        result = response.json()
-        print(f"   Message ID: {result['message_id']}")
-        print(f"   Status: {result['status']}")
 
-        # Get stats
-        print("\n3. Get email statistics...")
-        response = await client.get(
-            f"{SENDGRID_API_URL}/v3/stats",
-            headers={"Authorization": f"Bearer {SENDGRID_API_KEY}"}
-        )
-        print(f"   Status: {response.status_code}")
-        stats = response.json()
-        if stats.get("stats"):
-            metrics = stats["stats"][0]["stats"][0]["metrics"]
-            print(f"   Processed: {metrics.get('processed', 0)}")
-            print(f"   Delivered: {metrics.get('delivered', 0)}")
-
-        # Test invalid API key
-        print("\n4. Test invalid API key...")
-        response = await client.post(
-            f"{SENDGRID_API_URL}/v3/mail/send",
-            headers={"Authorization": "Bearer invalid-key"},
-            json={
-                "personalizations": [{"to": [{"email": "test@example.com"}]}],
-                "from": {"email": "sender@example.com"},
-                "subject": "Test",
-                "content": [{"type": "text/plain", "value": "Test"}]
-            }
-        )
-        print(f"   Status: {response.status_code} (expected 401)")
-
-    print("\n✅ SendGrid API tests completed!")
-
-
-async def test_mailgun_api():
-    """Test Mailgun API mock"""
-    print("\n=== Testing Mailgun API Mock ===")
-
-    async with httpx.AsyncClient() as client:
-        # Health check
-        print("\n1. Health check...")
-        response = await client.get(f"{MAILGUN_API_URL}/health")
-        print(f"   Status: {response.status_code}")
-
-        # Send email
-        print("\n2. Send email...")
-        response = await client.post(
-            f"{MAILGUN_API_URL}/{MAILGUN_DOMAIN}/messages",
-            auth=("api", MAILGUN_API_KEY.replace("api:", "")),
-            data={
-                "from": "sender@freeface.com",
-                "to": "user@example.com",
-                "subject": "Test Email from Mailgun Mock",
-                "text": "This is a test email!"
-            }
+@buffered_output
+async def test_freeface_api(client: httpx.AsyncClient, log):
+    """Test FreeFace API mock"""
+    log("\n=== Testing FreeFace API Mock ===")
+
+    # Health check
+    log("\n1. Health check...")
+    response = await client.get(f"{FREEFACE_API_URL}/health")
+    log(f"   Status: {response.status_code}")
+    log(f"   Response: {response.json()}")
+
+    # List users
+    log("\n2. List users (first page)...")
+    response = await client.get(
+        f"{FREEFACE_API_URL}/api/v1/users",
+        params={"page": 1, "per_page": 5}
+    )
+    log(f"   Status: {response.status_code}")
+    data = response.json()
+    log(f"   Total users: {data['pagination']['total']}")
+    log(f"   Retrieved: {len(data['data'])} users")
+
+    # Get first user ID for subsequent tests
+    user_id = data["data"][0]["id"] if data["data"] else None
+
+    if user_id:
+        # Get specific user
+        log(f"\n3. Get user profile (ID: {user_id[:8]}...)...")
+        response = await client.get(f"{FREEFACE_API_URL}/api/v1/users/{user_id}")
+        log(f"   Status: {response.status_code}")
+        user = response.json()
+        log(f"   User: {user['full_name']} ({user['email']})")
+
+        # Resolve multiple users
+        log("\n4. Resolve multiple users...")
+        response = await post_json(
+            client,
+            f"{FREEFACE_API_URL}/api/v1/users/resolve",
+            payload={"user_ids": [user_id, "nonexistent-id"]}
         )
-        print(f"   Status: {response.status_code}")
+        log(f"   Status: {response.status_code}")
         result = response.json()
-        print(f"   Message ID: {result['id']}")
-        print(f"   Message: {result['message']}")
-
-        # Get events
-        print("\n3. Get email events...")
+        log(f"   Found: {len(result['users'])} users")
+        log(f"   Not found: {len(result['not_found'])} users")
+
+    # List groups
+    log("\n5. List groups...")
+    response = await client.get(
+        f"{FREEFACE_API_URL}/api/v1/groups",
+        params={"page": 1, "per_page": 3}
+    )
+    log(f"   Status: {response.status_code}")
+    data = response.json()
+    log(f"   Total groups: {data['pagination']['total']}")
+
+    group_id = data["data"][0]["id"] if data["data"] else None
+
+    if group_id:
+        # Get group members
+        log(f"\n6. Get group members (ID: {group_id[:8]}...)...")
         response = await client.get(
-            f"{MAILGUN_API_URL}/{MAILGUN_DOMAIN}/events",
-            auth=("api", MAILGUN_API_KEY.replace("api:", ""))
+            f"{FREEFACE_API_URL}/api/v1/groups/{group_id}/members",
+            params={"page": 1, "per_page": 5}
         )
-        print(f"   Status: {response.status_code}")
-        events = response.json()
-        print(f"   Events: {len(events.get('items', []))}")
+        log(f"   Status: {response.status_code}")
+        data = response.json()
+        log(f"   Total members: {data['pagination']['total']}")
+        log(f"   Retrieved: {len(data['data'])} members")
 
-        # List domains
-        print("\n4. List domains...")
-        response = await client.get(
-            f"{MAILGUN_API_URL}/v3/domains",
-            auth=("api", MAILGUN_API_KEY.replace("api:", ""))
-        )
-        print(f"   Status: {response.status_code}")
-        domains = response.json()
-        print(f"   Total domains: {domains.get('total_count', 0)}")
+    # Test error simulation
+    log("\n7. Test error simulation (404)...")
+    response = await client.get(
+        f"{FREEFACE_API_URL}/api/v1/users/invalid-id",
+        params={"simulate_error": 404}
+    )
+    log(f"   Status: {response.status_code} (expected 404)")
 
-    print("\n✅ Mailgun API tests completed!")
+    log("\n✅ FreeFace API tests completed!")
 
 
-async def test_webhook_receiver():
+@buffered_output
+async def test_sendgrid_api(client: httpx.AsyncClient, log):
+    """Test SendGrid API mock"""
+    log("\n=== Testing SendGrid API Mock ===")
+
+    # Health check
+    log("\n1. Health check...")
+    response = await client.get(f"{SENDGRID_API_URL}/health")
+    log(f"   Status: {response.status_code}")
+
+    # Send email
+    log("\n2. Send email...")
+    response = await post_json(
+        client,
+        f"{SENDGRID_API_URL}/v3/mail/send",
+        headers={"Authorization": f"Bearer {SENDGRID_API_KEY}"},
+        payload={
+            "personalizations": [
+                {
+                    "to": [{"email": "user@example.com", "name": "Test User"}]
+                }
+            ],
+            "from": {"email": "sender@freeface.com", "name": "FreeFace"},
+            "subject": "Test Email from Mock",
+            "content": [
+                {
+                    "type": "text/plain",
+                    "value": "This is a test email from the SendGrid mock!"
+                }
+            ]
+        }
+    )
+    log(f"   Status: {response.status_code}")
+    result = response.json()
+    log(f"   Message ID: {result['message_id']}")
+    log(f"   Status: {result['status']}")
+
+    # Get stats
+    log("\n3. Get email statistics...")
+    response = await client.get(
+        f"{SENDGRID_API_URL}/v3/stats",
+        headers={"Authorization": f"Bearer {SENDGRID_API_KEY}"}
+    )
+    log(f"   Status: {response.status_code}")
+    stats = response.json()
+    if stats.get("stats"):
+        metrics = stats["stats"][0]["stats"][0]["metrics"]
+        log(f"   Processed: {metrics.get('processed', 0)}")
+        log(f"   Delivered: {metrics.get('delivered', 0)}")
+
+    # Test invalid API key
+    log("\n4. Test invalid API key...")
+    response = await post_json(
+        client,
+        f"{SENDGRID_API_URL}/v3/mail/send",
+        headers={"Authorization": "Bearer invalid-key"},
+        payload={
+            "personalizations": [{"to": [{"email": "test@example.com"}]}],
+            "from": {"email": "sender@example.com"},
+            "subject": "Test",
+            "content": [{"type": "text/plain", "value": "Test"}]
+        }
+    )
+    log(f"   Status: {response.status_code} (expected 401)")
+
+    log("\n✅ SendGrid API tests completed!")
+
+
+@buffered_output
+async def test_mailgun_api(client: httpx.AsyncClient, log):
+    """Test Mailgun API mock"""
+    log("\n=== Testing Mailgun API Mock ===")
+
+    # Health check
+    log("\n1. Health check...")
+    response = await client.get(f"{MAILGUN_API_URL}/health")
+    log(f"   Status: {response.status_code}")
+
+    # Send email
+    log("\n2. Send email...")
+    response = await client.post(
+        f"{MAILGUN_API_URL}/{MAILGUN_DOMAIN}/messages",
+        auth=("api", MAILGUN_API_KEY.replace("api:", "")),
+        data={
+            "from": "sender@freeface.com",
+            "to": "user@example.com",
+            "subject": "Test Email from Mailgun Mock",
+            "text": "This is a test email!"
+        }
+    )
+    log(f"   Status: {response.status_code}")
+    result = response.json()
+    log(f"   Message ID: {result['id']}")
+    log(f"   Message: {result['message']}")
+
+    # Get events
+    log("\n3. Get email events...")
+    response = await client.get(
+        f"{MAILGUN_API_URL}/{MAILGUN_DOMAIN}/events",
+        auth=("api", MAILGUN_API_KEY.replace("api:", ""))
+    )
+    log(f"   Status: {response.status_code}")
+    events = response.json()
+    log(f"   Events: {len(events.get('items', []))}")
+
+    # List domains
+    log("\n4. List domains...")
+    response = await client.get(
+        f"{MAILGUN_API_URL}/v3/domains",
+        auth=("api", MAILGUN_API_KEY.replace("api:", ""))
+    )
+    log(f"   Status: {response.status_code}")
+    domains = response.json()
+    log(f"   Total domains: {domains.get('total_count', 0)}")
+
+    # Test invalid API key from a browser origin
+    log("\n5. Test invalid API key with Origin header...")
+    response = await client.get(
+        f"{MAILGUN_API_URL}/v3/domains",
+        auth=("api", "invalid-key"),
+        headers={"Origin": "http://localhost:3000"}
+    )
+    allow_origin = response.headers.get("access-control-allow-origin")
+    log(f"   Status: {response.status_code} (expected 401)")
+    log(f"   Access-Control-Allow-Origin: {allow_origin} (expected *)")
+    assert allow_origin is not None, "401 response is missing CORS headers"
+
+    log("\n✅ Mailgun API tests completed!")
+
+
+@buffered_output
+async def test_webhook_receiver(client: httpx.AsyncClient, log):
     """Test Webhook Receiver mock"""
-    print("\n=== Testing Webhook Receiver Mock ===")
-
-    async with httpx.AsyncClient() as client:
-        # Health check
-        print("\n1. Health check...")
-        response = await client.get(f"{WEBHOOK_URL}/health")
-        print(f"   Status: {response.status_code}")
-
-        # Clear history first
-        print("\n2. Clear webhook history...")
-        response = await client.delete(f"{WEBHOOK_URL}/webhooks/history")
-        print(f"   Status: {response.status_code}")
-        print(f"   Response: {response.json()}")
-
-        # Send test webhooks
-        print("\n3. Send test webhooks...")
-        webhooks = [
-            {"event": "email.delivered", "email": "user1@example.com"},
-            {"event": "email.opened", "email": "user2@example.com"},
-            {"event": "email.clicked", "email": "user3@example.com"},
-        ]
-
-        for webhook_data in webhooks:
-            response = await client.post(
-                f"{WEBHOOK_URL}/webhooks/sendgrid",
-                json=webhook_data
-            )
-            print(f"   Sent webhook: {webhook_data['event']} - Status: {response.status_code}")
+    log("\n=== Testing Webhook Receiver Mock ===")
+
+    # Health check
+    log("\n1. Health check...")
+    response = await client.get(f"{WEBHOOK_URL}/health")
+    log(f"   Status: {response.status_code}")
+
+    # Clear history first
+    log("\n2. Clear webhook history...")
+    response = await client.delete(f"{WEBHOOK_URL}/webhooks/history")
+    log(f"   Status: {response.status_code}")
+    log(f"   Response: {response.json()}")
+
+    # Send test webhooks
+    log("\n3. Send test webhooks...")
+    webhooks = [
+        {"event": "email.delivered", "email": "user1@example.com"},
+        {"event": "email.opened", "email": "user2@example.com"},
+        {"event": "email.clicked", "email": "user3@example.com"},
+    ]
+
+    for webhook_data in webhooks:
+        response = await post_json(
+            client,
+            f"{WEBHOOK_URL}/webhooks/sendgrid",
+            payload=webhook_data
+        )
+        log(f"   Sent webhook: {webhook_data['event']} - Status: {response.status_code}")
 
-        # Get webhook history
-        print("\n4. Get webhook history...")
-        response = await client.get(f"{WEBHOOK_URL}/webhooks/history")
-        print(f"   Status: {response.status_code}")
-        history = response.json()
-        print(f"   Total webhooks: {history['total']}")
-        print(f"   Retrieved: {len(history['webhooks'])}")
+    # Get webhook history
+    log("\n4. Get webhook history...")
+    response = await client.get(f"{WEBHOOK_URL}/webhooks/history")
+    log(f"   Status: {response.status_code}")
+    history = response.json()
+    log(f"   Total webhooks: {history['total']}")
+    log(f"   Retrieved: {len(history['webhooks'])}")
 
-        # Get webhook stats
-        print("\n5. Get webhook statistics...")
-        response = await client.get(f"{WEBHOOK_URL}/webhooks/stats")
-        print(f"   Status: {response.status_code}")
-        stats = response.json()
-        print(f"   Total webhooks: {stats['total_webhooks']}")
-        print(f"   By method: {stats['by_method']}")
+    # Get webhook stats
+    log("\n5. Get webhook statistics...")
+    response = await client.get(f"{WEBHOOK_URL}/webhooks/stats")
+    log(f"   Status: {response.status_code}")
+    stats = response.json()
+    log(f"   Total webhooks: {stats['total_webhooks']}")
+    log(f"   By method: {stats['by_method']}")
 
-    print("\n✅ Webhook Receiver tests completed!")
+    log("\n✅ Webhook Receiver tests completed!")
 
 
 async def main():
@@ -282,10 +330,18 @@ async def main():
     print("=" * 60)
 
     try:
-        await test_freeface_api()
-        await test_sendgrid_api()
-        await test_mailgun_api()
-        await test_webhook_receiver()
+        # One client (and keep-alive pool) shared by all suites; suites
+        # target different servers, so run them concurrently
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        ) as client:
+            await asyncio.gather(
+                test_freeface_api(client),
+                test_sendgrid_api(client),
+                test_mailgun_api(client),
+                test_webhook_receiver(client),
+            )
 
         print("\n" + "=" * 60)
         print("✅ All tests completed successfully!")
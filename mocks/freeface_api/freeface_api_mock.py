@@ -2,14 +2,13 @@
 # File: mocks/freeface_api/freeface_api_mock.py
 # FreeFace Platform API Mock Server
 
-import sys
-from pathlib import Path
+import random
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+import orjson
 from fastapi import Depends, HTTPException, Query
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from fastapi.responses import ORJSONResponse, Response
 
 from common.base_mock import BaseMockServer
 from common.error_simulator import ErrorSimulator
@@ -17,15 +16,32 @@ from common.middleware import add_mock_middleware
 from common.mock_data_generator import MockDataGenerator
 from freeface_api.models import (
     GroupDetails,
-    GroupMemberWithProfile,
     PaginatedGroupMembersResponse,
-    PaginationMeta,
     UserProfile,
     UserResolveRequest,
     UserResolveResponse,
 )
 
 
+@lru_cache(maxsize=1024)
+def _pagination(page: int, per_page: int, total: int) -> Dict:
+    """
+    Pagination metadata (PaginationMeta shape) as a plain dict
+
+    Seed data never changes, so each (page, per_page, total) combination is
+    built once and the same dict is reused by every later request.
+    """
+    total_pages = (total + per_page - 1) // per_page
+    return {
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_prev": page > 1,
+    }
+
+
 class FreeFaceAPIMock(BaseMockServer):
     """
     Mock server for FreeFace Platform API
@@ -58,12 +74,24 @@ class FreeFaceAPIMock(BaseMockServer):
 
         # Initialize utilities
         self.data_generator = MockDataGenerator(seed=42)  # Reproducible data
+        self._rng = random.Random(42)  # Reproducible group membership
         self.error_simulator = ErrorSimulator()
 
         # In-memory storage
         self.users: Dict[str, UserProfile] = {}
         self.groups: Dict[str, GroupDetails] = {}
         self.group_members: Dict[str, List[str]] = {}  # group_id -> [user_ids]
+        # group_id -> membership dicts (GroupMemberWithProfile shape), built once
+        self.group_member_records: Dict[str, List[Dict]] = {}
+        # model_dump() of the seed data, so list endpoints never re-serialize models
+        self.users_dumped: Dict[str, Dict] = {}
+        self.groups_dumped: Dict[str, Dict] = {}
+        # Pre-encoded JSON bodies for the single-item endpoints
+        self.users_json: Dict[str, bytes] = {}
+        self.groups_json: Dict[str, bytes] = {}
+        # Insertion-ordered dumps for list pagination (sliced, never copied)
+        self._users_list: List[Dict] = []
+        self._groups_list: List[Dict] = []
 
         # Generate seed data
         self._generate_seed_data()
@@ -89,28 +117,46 @@ class FreeFaceAPIMock(BaseMockServer):
             self.users[user.id] = user
 
         # Generate 10 groups
+        user_ids = list(self.users.keys())
         for _ in range(10):
             group_data = self.data_generator.generate_group()
             group = GroupDetails(**group_data)
             self.groups[group.id] = group
 
             # Assign random users to each group
-            user_ids = list(self.users.keys())
-            import random
-            random.seed(42)
-            member_count = random.randint(5, 20)
-            members = random.sample(user_ids, min(member_count, len(user_ids)))
+            member_count = self._rng.randint(5, 20)
+            members = self._rng.sample(user_ids, min(member_count, len(user_ids)))
             self.group_members[group.id] = members
 
             # Update member count
             group.member_count = len(members)
 
+        self.users_dumped = {uid: user.model_dump() for uid, user in self.users.items()}
+        self.groups_dumped = {gid: group.model_dump() for gid, group in self.groups.items()}
+        self.users_json = {uid: orjson.dumps(user) for uid, user in self.users_dumped.items()}
+        self.groups_json = {gid: orjson.dumps(group) for gid, group in self.groups_dumped.items()}
+        self._users_list = list(self.users_dumped.values())
+        self._groups_list = list(self.groups_dumped.values())
+
+        # Membership is static seed data: generate role/joined_at once per member
+        generate_group_member = self.data_generator.generate_group_member
+        for group_id, members in self.group_members.items():
+            self.group_member_records[group_id] = [
+                {
+                    **generate_group_member(user_id=user_id, group_id=group_id),
+                    "profile": self.users_dumped[user_id],
+                }
+                for user_id in members
+            ]
+
         self.logger.debug("Generated seed data: users=%d, groups=%d", len(self.users), len(self.groups))
 
     def _setup_routes(self):
         """Setup API routes"""
 
-        @self.app.get("/api/v1/users/{user_id}", response_model=UserProfile)
+        # Routes return pre-encoded/pre-dumped seed data as responses directly;
+        # the models only document the schemas in /docs
+        @self.app.get("/api/v1/users/{user_id}", responses={200: {"model": UserProfile}})
         async def get_user(
             user_id: str,
             _error_check=Depends(self.check_error_simulation)
@@ -129,9 +175,9 @@ class FreeFaceAPIMock(BaseMockServer):
             if user_id not in self.users:
                 self.error_simulator.raise_not_found("user", user_id)
 
-            return self.users[user_id]
+            return Response(self.users_json[user_id], media_type="application/json")
 
-        @self.app.post("/api/v1/users/resolve", response_model=UserResolveResponse)
+        @self.app.post("/api/v1/users/resolve", responses={200: {"model": UserResolveResponse}})
         async def resolve_users(
             request: UserResolveRequest,
             _error_check=Depends(self.check_error_simulation)
@@ -156,19 +202,22 @@ class FreeFaceAPIMock(BaseMockServer):
 
             found_users = []
             not_found = []
+            get_user_dump = self.users_dumped.get
 
+            # One hash lookup per ID
             for user_id in request.user_ids:
-                if user_id in self.users:
-                    found_users.append(self.users[user_id])
+                user = get_user_dump(user_id)
+                if user is not None:
+                    found_users.append(user)
                 else:
                     not_found.append(user_id)
 
-            return UserResolveResponse(
-                users=found_users,
-                not_found=not_found
-            )
+            return ORJSONResponse({
+                "users": found_users,
+                "not_found": not_found
+            })
 
-        @self.app.get("/api/v1/groups/{group_id}", response_model=GroupDetails)
+        @self.app.get("/api/v1/groups/{group_id}", responses={200: {"model": GroupDetails}})
         async def get_group(
             group_id: str,
             _error_check=Depends(self.check_error_simulation)
@@ -186,11 +235,11 @@ class FreeFaceAPIMock(BaseMockServer):
             if group_id not in self.groups:
                 self.error_simulator.raise_not_found("group", group_id)
 
-            return self.groups[group_id]
+            return Response(self.groups_json[group_id], media_type="application/json")
 
         @self.app.get(
             "/api/v1/groups/{group_id}/members",
-            response_model=PaginatedGroupMembersResponse
+            responses={200: {"model": PaginatedGroupMembersResponse}}
         )
         async def list_group_members(
             group_id: str,
@@ -215,47 +264,19 @@ class FreeFaceAPIMock(BaseMockServer):
             if group_id not in self.groups:
                 self.error_simulator.raise_not_found("group", group_id)
 
-            # Get member user IDs
-            member_ids = self.group_members.get(group_id, [])
+            # Precomputed member records with profiles
+            member_records = self.group_member_records.get(group_id, [])
 
             # Calculate pagination
-            total = len(member_ids)
-            total_pages = (total + per_page - 1) // per_page
+            total = len(member_records)
             start_idx = (page - 1) * per_page
             end_idx = start_idx + per_page
 
-            # Get paginated member IDs
-            page_member_ids = member_ids[start_idx:end_idx]
-
-            # Build member objects with profiles
-            members_with_profiles = []
-            for user_id in page_member_ids:
-                if user_id in self.users:
-                    member_data = self.data_generator.generate_group_member(
-                        user_id=user_id,
-                        group_id=group_id
-                    )
-                    member = GroupMemberWithProfile(
-                        **member_data,
-                        profile=self.users[user_id]
-                    )
-                    members_with_profiles.append(member)
-
-            # Build pagination metadata
-            pagination = PaginationMeta(
-                page=page,
-                per_page=per_page,
-                total=total,
-                total_pages=total_pages,
-                has_next=page < total_pages,
-                has_prev=page > 1
-            )
-
-            return PaginatedGroupMembersResponse(
-                data=members_with_profiles,
-                pagination=pagination,
-                timestamp=self.data_generator.generate_timestamp()
-            )
+            return ORJSONResponse({
+                "data": member_records[start_idx:end_idx],
+                "pagination": _pagination(page, per_page, total),
+                "timestamp": self.data_generator.generate_timestamp()
+            })
 
         @self.app.get("/api/v1/users")
         async def list_users(
@@ -272,28 +293,18 @@ class FreeFaceAPIMock(BaseMockServer):
             """
             self.logger.info("List users (page=%d, per_page=%d)", page, per_page)
 
-            all_users = list(self.users.values())
+            all_users = self._users_list
             total = len(all_users)
-            total_pages = (total + per_page - 1) // per_page
             start_idx = (page - 1) * per_page
             end_idx = start_idx + per_page
 
             page_users = all_users[start_idx:end_idx]
 
-            pagination = PaginationMeta(
-                page=page,
-                per_page=per_page,
-                total=total,
-                total_pages=total_pages,
-                has_next=page < total_pages,
-                has_prev=page > 1
-            )
-
-            return {
+            return ORJSONResponse({
                 "data": page_users,
-                "pagination": pagination,
+                "pagination": _pagination(page, per_page, total),
                 "timestamp": self.data_generator.generate_timestamp()
-            }
+            })
 
         @self.app.get("/api/v1/groups")
         async def list_groups(
@@ -310,28 +321,18 @@ class FreeFaceAPIMock(BaseMockServer):
             """
             self.logger.info("List groups (page=%d, per_page=%d)", page, per_page)
 
-            all_groups = list(self.groups.values())
+            all_groups = self._groups_list
             total = len(all_groups)
-            total_pages = (total + per_page - 1) // per_page
             start_idx = (page - 1) * per_page
             end_idx = start_idx + per_page
 
             page_groups = all_groups[start_idx:end_idx]
 
-            pagination = PaginationMeta(
-                page=page,
-                per_page=per_page,
-                total=total,
-                total_pages=total_pages,
-                has_next=page < total_pages,
-                has_prev=page > 1
-            )
-
-            return {
+            return ORJSONResponse({
                 "data": page_groups,
-                "pagination": pagination,
+                "pagination": _pagination(page, per_page, total),
                 "timestamp": self.data_generator.generate_timestamp()
-            }
+            })
 
 
 def main():
@@ -2,24 +2,59 @@
 # File: mocks/webhook_receiver/webhook_receiver_mock.py
 # Webhook Receiver Mock Server - Catch-all for testing webhooks
 
-import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import time
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
 
+import orjson
 from fastapi import Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from common.base_mock import BaseMockServer
 from common.middleware import add_mock_middleware
 from common.mock_data_generator import MockDataGenerator
 
 
+# Records encoded per chunk when streaming /webhooks/history
+HISTORY_STREAM_BATCH = 100
+
+
+@lru_cache(maxsize=1)
+def _utc_second(second: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as ISO 8601 with microseconds (e.g. 2024-01-20T10:00:00.123456Z)
+
+    Webhooks arrive in bursts within the same second, so the formatted
+    second is reused and only the microseconds are formatted per call.
+    """
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_utc_second(second)}.{nanos // 1000:06d}Z"
+
+
+async def _stream_history_json(
+    records: List[Dict[str, Any]],
+    total: int,
+    limit: int,
+    offset: int
+) -> AsyncIterator[bytes]:
+    """Yield the /webhooks/history JSON body, encoding HISTORY_STREAM_BATCH records at a time"""
+    dumps = orjson.dumps
+    yield b'{"webhooks":['
+    for start in range(0, len(records), HISTORY_STREAM_BATCH):
+        chunk = b",".join([dumps(record) for record in records[start:start + HISTORY_STREAM_BATCH]])
+        yield chunk if start == 0 else b"," + chunk
+    yield b'],"total":%d,"limit":%d,"offset":%d}' % (total, limit, offset)
+
+
 class WebhookRecord(BaseModel):
-    """Webhook request record"""
+    """Webhook request record (documents the dicts stored by the mock)"""
     id: str
     timestamp: str
     method: str
@@ -70,8 +105,15 @@ class WebhookReceiverMock(BaseMockServer):
         # Initialize utilities
         self.data_generator = MockDataGenerator()
 
-        # In-memory storage for received webhooks
-        self.webhook_history: List[WebhookRecord] = []
+        # In-memory storage for received webhooks, stored as plain dicts
+        # (WebhookRecord shape) so reads need no per-record dump. Bounded to
+        # the newest MOCK_RETENTION records.
+        self.retention = self.config.retention
+        self.webhook_history: Deque[Dict[str, Any]] = deque(maxlen=self.retention)
+        self.webhook_index: Dict[str, Dict[str, Any]] = {}  # webhook id -> record
+        # Running totals for /webhooks/stats, updated on insert, evict and clear
+        self.method_counts: Counter = Counter()
+        self.path_counts: Counter = Counter()
 
         # Add middleware
         add_mock_middleware(self.app, enable_logging=True, enable_delay=False)
@@ -81,6 +123,28 @@ class WebhookReceiverMock(BaseMockServer):
 
         self.logger.info("Webhook receiver mock initialized")
 
+    def _store(self, record: Dict[str, Any]):
+        """Store a webhook record, evicting the oldest beyond retention"""
+        if not self.retention:
+            # MOCK_RETENTION=0 keeps nothing; the index and counters must not either
+            return
+
+        if len(self.webhook_history) == self.retention:
+            evicted = self.webhook_history[0]
+            del self.webhook_index[evicted["id"]]
+            self.method_counts.subtract((evicted["method"],))
+            self.path_counts.subtract((evicted["path"],))
+            # Drop zeroed keys so stats only list what is still stored
+            if not self.method_counts[evicted["method"]]:
+                del self.method_counts[evicted["method"]]
+            if not self.path_counts[evicted["path"]]:
+                del self.path_counts[evicted["path"]]
+
+        self.webhook_history.append(record)
+        self.webhook_index[record["id"]] = record
+        self.method_counts[record["method"]] += 1
+        self.path_counts[record["path"]] += 1
+
     def _setup_routes(self):
         """Setup API routes"""
 
@@ -113,7 +177,7 @@ class WebhookReceiverMock(BaseMockServer):
             content_type = request.headers.get("content-type", "")
             try:
                 if "application/json" in content_type:
-                    body = await request.json()
+                    body = orjson.loads(await request.body())
                 elif "application/x-www-form-urlencoded" in content_type:
                     body = dict(await request.form())
                 else:
@@ -124,33 +188,33 @@ class WebhookReceiverMock(BaseMockServer):
                 body = None
 
             # Create record
-            record = WebhookRecord(
-                id=self.data_generator.generate_uuid(),
-                timestamp=datetime.utcnow().isoformat() + "Z",
-                method=request.method,
-                path=f"/webhooks/{path}",
-                headers=headers,
-                query_params=query_params,
-                body=body,
-                content_type=content_type
-            )
+            record = {
+                "id": self.data_generator.generate_uuid(),
+                "timestamp": _utc_now_iso(),
+                "method": request.method,
+                "path": f"/webhooks/{path}",
+                "headers": headers,
+                "query_params": query_params,
+                "body": body,
+                "content_type": content_type,
+            }
 
             # Store webhook
-            self.webhook_history.append(record)
+            self._store(record)
 
             self.logger.info(
                 "Webhook stored: %s (total: %d)",
-                record.id,
+                record["id"],
                 len(self.webhook_history)
             )
 
             # Return success
-            return {
+            return ORJSONResponse({
                 "status": "received",
-                "webhook_id": record.id,
-                "timestamp": record.timestamp,
+                "webhook_id": record["id"],
+                "timestamp": record["timestamp"],
                 "message": "Webhook received successfully"
-            }
+            })
 
         @self.app.get("/webhooks/history")
         async def get_webhook_history(
@@ -168,16 +232,19 @@ class WebhookReceiverMock(BaseMockServer):
             """
             self.logger.info("Get webhook history (limit=%d, offset=%d)", limit, offset)
 
-            # Get paginated history (newest first)
-            history = list(reversed(self.webhook_history))
-            paginated = history[offset:offset + limit]
-
-            return {
-                "webhooks": [w.model_dump() for w in paginated],
-                "total": len(self.webhook_history),
-                "limit": limit,
-                "offset": offset
-            }
+            # Get paginated history (newest first); only the requested window
+            # is copied, not the whole history. The page is snapshotted as
+            # references (new webhooks may arrive while streaming) and encoded
+            # in batches, so the full JSON body is never held in memory.
+            offset = max(offset, 0)
+            paginated = list(islice(
+                reversed(self.webhook_history), offset, offset + max(limit, 0)
+            ))
+
+            return StreamingResponse(
+                _stream_history_json(paginated, len(self.webhook_history), limit, offset),
+                media_type="application/json"
+            )
 
         @self.app.get("/webhooks/history/{webhook_id}")
         async def get_webhook_by_id(webhook_id: str):
@@ -189,9 +256,9 @@ class WebhookReceiverMock(BaseMockServer):
             """
             self.logger.info("Get webhook: %s", webhook_id)
 
-            for webhook in self.webhook_history:
-                if webhook.id == webhook_id:
-                    return webhook.model_dump()
+            webhook = self.webhook_index.get(webhook_id)
+            if webhook is not None:
+                return ORJSONResponse(webhook)
 
             from common.error_simulator import ErrorSimulator
             error_sim = ErrorSimulator()
@@ -206,14 +273,17 @@ class WebhookReceiverMock(BaseMockServer):
             """
             count = len(self.webhook_history)
             self.webhook_history.clear()
+            self.webhook_index.clear()
+            self.method_counts.clear()
+            self.path_counts.clear()
 
             self.logger.info("Webhook history cleared (%d records deleted)", count)
 
-            return {
+            return ORJSONResponse({
                 "status": "cleared",
                 "deleted_count": count,
                 "message": f"Cleared {count} webhook records"
-            }
+            })
 
         @self.app.get("/webhooks/stats")
         async def get_webhook_stats():
@@ -224,21 +294,13 @@ class WebhookReceiverMock(BaseMockServer):
             """
             self.logger.info("Get webhook stats")
 
-            # Count by method
-            method_counts = {}
-            path_counts = {}
-
-            for webhook in self.webhook_history:
-                method_counts[webhook.method] = method_counts.get(webhook.method, 0) + 1
-                path_counts[webhook.path] = path_counts.get(webhook.path, 0) + 1
-
-            return {
+            return ORJSONResponse({
                 "total_webhooks": len(self.webhook_history),
-                "by_method": method_counts,
-                "by_path": path_counts,
-                "oldest": self.webhook_history[0].timestamp if self.webhook_history else None,
-                "newest": self.webhook_history[-1].timestamp if self.webhook_history else None
-            }
+                "by_method": self.method_counts,
+                "by_path": self.path_counts,
+                "oldest": self.webhook_history[0]["timestamp"] if self.webhook_history else None,
+                "newest": self.webhook_history[-1]["timestamp"] if self.webhook_history else None
+            })
 
 
 def main():
@@ -1,13 +1,15 @@
 # File: monitor.py
 # Email System Monitoring Dashboard
 
-import json
+import asyncio
 import logging
 import os
+import time
 from datetime import datetime, timedelta
 
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
 
 from config.logging_config import setup_logging
@@ -31,6 +33,14 @@ config = EmailConfig(
 )
 email_service = EmailService(config)
 
+# Rendered dashboard HTML and /api/stats JSON, shared by all polls within the TTL
+# so any number of open dashboards costs one Redis read and one render per window
+DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", 1.5))
+_dashboard_cache = {"expires_at": 0.0, "body": b""}
+_dashboard_lock = asyncio.Lock()
+_stats_cache = {"expires_at": 0.0, "body": b""}
+_stats_lock = asyncio.Lock()
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -49,9 +59,32 @@ async def shutdown_event():
     logger.info("Email monitoring dashboard stopped")
 
 
-@app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Main monitoring dashboard"""
+# (provider, stats key, bucket size) per rate limit; config is fixed at startup
+_RATE_LIMITS = tuple(
+    (provider, f"rate_{provider}_tokens", limits["bucket_size"])
+    for provider, limits in config.rate_limits.items()
+)
+
+
+def _compute_rate_status(stats: dict) -> dict:
+    """Token count and bucket utilization per provider ("N/A" when no bucket exists yet)"""
+    rate_status = {}
+    for provider, tokens_key, bucket_size in _RATE_LIMITS:
+        tokens = stats.get(tokens_key)
+        if tokens is not None:
+            utilization = (1 - int(tokens) / bucket_size) * 100
+            rate_status[provider] = {
+                "tokens": tokens,
+                "limit": bucket_size,
+                "utilization": f"{utilization:.1f}%",
+            }
+        else:
+            rate_status[provider] = {"tokens": "N/A", "limit": bucket_size, "utilization": "N/A"}
+    return rate_status
+
+
+async def _render_dashboard(request: Request):
+    """Render the dashboard template from fresh stats"""
     stats = await email_service.get_stats()
 
     # Calculate additional metrics
@@ -66,22 +99,7 @@ async def dashboard(request: Request):
     success_rate = (sent_today / max(1, sent_today + failed_today)) * 100
 
     # Rate limit status
-    rate_status = {}
-    for provider, limits in config.rate_limits.items():
-        tokens = stats.get(f"rate_{provider}_tokens", "N/A")
-        if tokens != "N/A":
-            utilization = (1 - int(tokens) / limits["bucket_size"]) * 100
-            rate_status[provider] = {
-                "tokens": tokens,
-                "limit": limits["bucket_size"],
-                "utilization": f"{utilization:.1f}%",
-            }
-        else:
-            rate_status[provider] = {
-                "tokens": "N/A",
-                "limit": limits["bucket_size"],
-                "utilization": "N/A",
-            }
+    rate_status = _compute_rate_status(stats)
 
     dashboard_data = {
         "total_queued": total_queued,
@@ -100,10 +118,35 @@ async def dashboard(request: Request):
     )
 
 
+@app.get("/", response_class=HTMLResponse)
+async def dashboard(request: Request):
+    """Main monitoring dashboard"""
+    async with _dashboard_lock:
+        if time.monotonic() >= _dashboard_cache["expires_at"]:
+            response = await _render_dashboard(request)
+            _dashboard_cache["body"] = response.body
+            _dashboard_cache["expires_at"] = time.monotonic() + DASHBOARD_CACHE_TTL
+
+    return HTMLResponse(content=_dashboard_cache["body"])
+
+
 @app.get("/api/stats")
 async def api_stats():
     """JSON API for real-time stats"""
-    return await email_service.get_stats()
+    async with _stats_lock:
+        if time.monotonic() >= _stats_cache["expires_at"]:
+            _stats_cache["body"] = orjson.dumps(await email_service.get_stats())
+            _stats_cache["expires_at"] = time.monotonic() + DASHBOARD_CACHE_TTL
+
+    return Response(content=_stats_cache["body"], media_type="application/json")
+
+
+def _safe_loads(job_data):
+    """Decode a dead-letter entry, or None if it is not valid JSON"""
+    try:
+        return orjson.loads(job_data)
+    except orjson.JSONDecodeError:
+        return None
 
 
 @app.get("/api/dead-letter")
@@ -112,15 +155,9 @@ async def dead_letter_queue():
     redis = email_service.redis_client.redis
     dead_letters = await redis.lrange("email:dead_letter", 0, 50)
 
-    jobs = []
-    for job_data in dead_letters:
-        try:
-            job = json.loads(job_data)
-            jobs.append(job)
-        except json.JSONDecodeError:
-            continue
+    jobs = [job for job in map(_safe_loads, dead_letters) if job is not None]
 
-    return {"dead_letter_jobs": jobs, "count": len(jobs)}
+    return ORJSONResponse({"dead_letter_jobs": jobs, "count": len(jobs)})
 
 
 @app.get("/api/service-metrics")
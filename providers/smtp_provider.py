@@ -5,7 +5,10 @@
 import logging
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Dict
+from email.policy import SMTP as SMTP_POLICY
+from email.policy import SMTPUTF8 as SMTPUTF8_POLICY
+from email.utils import parseaddr
+from typing import Dict, List, Tuple
 
 import aiosmtplib
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -19,6 +22,21 @@ from .base_provider import EmailProviderBase
 logger = logging.getLogger(__name__)
 
 
+def _recipient_header(sender: str, address: str) -> Tuple[bytes, List[str]]:
+    """
+    Encoded and folded To header for one recipient, plus the MAIL options it needs
+
+    Goes through the email policy's header registry like send_message() would
+    (rejects CR/LF, encodes display names) and requests SMTPUTF8 when either
+    envelope address is non-ASCII.
+    """
+    if sender.isascii() and address.isascii():
+        policy, mail_options = SMTP_POLICY, []
+    else:
+        policy, mail_options = SMTPUTF8_POLICY, ["SMTPUTF8"]
+    return policy.fold_binary(*policy.header_store_parse("To", address)), mail_options
+
+
 class SMTPProvider(EmailProviderBase):
     """SMTP email provider using aiosmtplib"""
 
@@ -94,7 +112,14 @@ class SMTPProvider(EmailProviderBase):
         html_part = MIMEText(html_content, "html")
         message.attach(html_part)
 
-        logger.debug("SMTP: MIME message constructed")
+        # Flatten the MIME message once per job; each recipient only gets its own
+        # To header prepended instead of re-serializing the whole message. The
+        # message is built here with From/Subject only, so there are no
+        # Bcc/Resent-* headers that send_message() would have had to strip.
+        message_bytes = message.as_bytes(policy=SMTP_POLICY)
+        sender = parseaddr(self.config["from_email"])[1]
+
+        logger.debug("SMTP: MIME message constructed, %s bytes", len(message_bytes))
 
         # Send to each recipient
         try:
@@ -144,18 +169,21 @@ class SMTPProvider(EmailProviderBase):
                     for email in job.to:
                         logger.debug("SMTP: Sending to %s", email)
 
-                        message["To"] = email
+                        to_header, mail_options = _recipient_header(sender, email)
 
                         with log_timing(f"smtp_send_to_{email}", logger):
-                            await smtp.send_message(message)
+                            await smtp.sendmail(
+                                sender,
+                                [email],
+                                to_header + message_bytes,
+                                mail_options=mail_options,
+                            )
 
                         sent_count += 1
                         logger.debug(
                             "SMTP: Successfully sent to %s (%s/%s)", email, sent_count, len(job.to)
                         )
 
-                        del message["To"]
-
                     logger.info(
                         "SMTP: Job %s sent successfully to %s recipient(s)", job.job_id, sent_count
                     )
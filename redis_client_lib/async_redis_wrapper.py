@@ -44,6 +44,15 @@ class AsyncRedisWrapper:
             return async_wrapper
         return attr
 
+    def pipeline(self, transaction: bool = True) -> Any:
+        """Create a pipeline (queueing commands does no I/O; see execute_pipeline)"""
+        return self._redis.pipeline(transaction=transaction)
+
+    async def execute_pipeline(self, pipe: Any) -> list:
+        """Send all commands queued on a pipeline in a single round trip"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, pipe.execute)
+
     async def script_load(self, script: str) -> str:
         """Load a Lua script"""
         loop = asyncio.get_event_loop()
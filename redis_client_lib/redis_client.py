@@ -6,7 +6,7 @@ import asyncio
 import json
 import logging
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import redis
 
@@ -94,9 +94,106 @@ class RedisEmailClient:
         return stream_id
         """
 
+        # Scheduled enqueue script (job payload + schedule entry + counter in one call)
+        schedule_script = """
+        local scheduled_key = KEYS[1]
+        local job_key = KEYS[2]
+        local stats_key = KEYS[3]
+        local job_id = ARGV[1]
+        local job_data = ARGV[2]
+        local scheduled_at = ARGV[3]
+        local job_ttl = tonumber(ARGV[4])
+        
+        redis.call('SET', job_key, job_data, 'EX', job_ttl)
+        redis.call('ZADD', scheduled_key, scheduled_at, job_id)
+        redis.call('HINCRBY', stats_key, 'scheduled', 1)
+        return job_id
+        """
+
+        # Scheduled job promotion script (due jobs -> priority streams in one call).
+        # Every key is declared in KEYS: the schedule, the dedup set, the three
+        # priority streams, then one payload key per job. On Redis Cluster these
+        # would all need to share a hash slot; the deployment is single-node.
+        # Priorities are resolved in Python, so the script never parses JSON.
+        promote_scheduled_script = """
+        local scheduled_key = KEYS[1]
+        local dedup_key = KEYS[2]
+        local streams = {high = KEYS[3], medium = KEYS[4], low = KEYS[5]}
+        local promoted = {}
+        
+        -- ARGV holds (job_id, priority) pairs matching KEYS[6..]; an empty
+        -- priority means the payload expired or was malformed: drop the job
+        for i = 1, #ARGV, 2 do
+            local job_id = ARGV[i]
+            local stream_key = streams[ARGV[i + 1]]
+            local job_key = KEYS[5 + (i + 1) / 2]
+            
+            if stream_key and redis.call('SISMEMBER', dedup_key, job_id) == 0 then
+                local job_data = redis.call('GET', job_key)
+                if job_data then
+                    redis.call('SADD', dedup_key, job_id)
+                    redis.call('XADD', stream_key, '*', 'job', job_data)
+                    table.insert(promoted, job_id)
+                end
+            end
+            
+            redis.call('ZREM', scheduled_key, job_id)
+            redis.call('DEL', job_key)
+        end
+        
+        if #promoted > 0 then
+            redis.call('EXPIRE', dedup_key, 3600)  -- 1 hour dedup window
+        end
+        
+        return promoted
+        """
+
+        # Group expansion script (cached member list minus excluded members).
+        # Only the raw member list is cached; exclusions are applied on every
+        # call so unsubscribes take effect on the next send.
+        expand_group_script = """
+        local cache_key = KEYS[1]
+        local members_key = KEYS[2]
+        local excluded_key = KEYS[3]
+        local ttl = tonumber(ARGV[1])
+        
+        local members
+        local cached = redis.call('GET', cache_key)
+        if cached then
+            members = cjson.decode(cached)
+        else
+            members = redis.call('LRANGE', members_key, 0, -1)
+            redis.call('SET', cache_key, cjson.encode(members), 'EX', ttl)
+        end
+        
+        local excluded = redis.call('LRANGE', excluded_key, 0, -1)
+        if #excluded == 0 then
+            return cjson.encode(members)
+        end
+        
+        local skip = {}
+        for _, email in ipairs(excluded) do
+            skip[email] = true
+        end
+        
+        local recipients = {}
+        for _, email in ipairs(members) do
+            if not skip[email] then
+                table.insert(recipients, email)
+            end
+        end
+        
+        return cjson.encode(recipients)
+        """
+
         # Register scripts
         self._lua_scripts["token_bucket"] = await self.redis.script_load(token_bucket_script)
         self._lua_scripts["enqueue"] = await self.redis.script_load(enqueue_script)
+        self._lua_scripts["schedule"] = await self.redis.script_load(schedule_script)
+        self._lua_scripts["expand_group"] = await self.redis.script_load(expand_group_script)
+        self._lua_scripts["promote_scheduled"] = await self.redis.script_load(
+            promote_scheduled_script
+        )
 
     async def check_rate_limit(self, provider: str, tokens_needed: int = 1) -> bool:
         """Check rate limit using token bucket algorithm"""
@@ -132,6 +229,85 @@ class RedisEmailClient:
 
         return stream_id
 
+    async def schedule_email(self, job: EmailJob, scheduled_at: float, ttl: int = 86400 * 7) -> str:
+        """Store job payload and add it to the scheduled set atomically"""
+        return await self.redis.evalsha(
+            self._lua_scripts["schedule"],
+            3,  # Number of keys
+            "email:scheduled",
+            f"email:job:{job.job_id}",
+            "email:stats:daily",
+            job.job_id,
+            job.json(),
+            scheduled_at,
+            ttl,
+        )
+
+    async def promote_scheduled(self, now: float, limit: int = 500) -> Tuple[int, List[str]]:
+        """
+        Move up to ``limit`` due scheduled jobs to their priority streams
+
+        Payloads are read and their priorities resolved here; a single script
+        call then enqueues them and removes them from the schedule atomically.
+        Expired or malformed payloads are dropped from the schedule so they
+        cannot block later batches.
+
+        Returns:
+            Tuple of (due jobs removed from the schedule, ids of jobs enqueued)
+        """
+        job_ids = await self.redis.zrangebyscore("email:scheduled", 0, now, start=0, num=limit)
+        if not job_ids:
+            return 0, []
+
+        job_keys = [f"email:job:{job_id}" for job_id in job_ids]
+        pipe = self.redis.pipeline(transaction=False)
+        for job_key in job_keys:
+            pipe.get(job_key)
+        payloads = await self.redis.execute_pipeline(pipe)
+
+        args = []
+        for job_id, job_data in zip(job_ids, payloads):
+            priority = ""
+            if job_data:
+                try:
+                    priority = EmailPriority(json.loads(job_data)["priority"]).value
+                except (ValueError, KeyError, TypeError) as e:
+                    logging.error("Dropping malformed scheduled job %s: %s", job_id, e)
+            args.extend((job_id, priority))
+
+        promoted = await self.redis.evalsha(
+            self._lua_scripts["promote_scheduled"],
+            5 + len(job_keys),  # Number of keys
+            "email:scheduled",
+            "email:dedup",
+            f"email:queue:{EmailPriority.HIGH.value}",
+            f"email:queue:{EmailPriority.MEDIUM.value}",
+            f"email:queue:{EmailPriority.LOW.value}",
+            *job_keys,
+            *args,
+        )
+
+        return len(job_ids), promoted
+
+    async def expand_group(self, group_id: str) -> List[str]:
+        """
+        Resolve group member emails (minus excluded members) in a single round trip
+
+        The member list is cached for config.group_cache_ttl seconds; the
+        excluded list is read on every call.
+        """
+        encoded = await self.redis.evalsha(
+            self._lua_scripts["expand_group"],
+            3,  # Number of keys
+            f"groupcache:{group_id}",
+            f"group:{group_id}:emails",
+            f"group:{group_id}:excluded",
+            self.config.group_cache_ttl,
+        )
+
+        # cjson encodes an empty Lua table as an object ("{}")
+        return json.loads(encoded) or []
+
     async def dequeue_email(
         self, consumer_group: str, consumer_name: str, count: int = 1
     ) -> List[EmailJob]:
@@ -224,17 +400,28 @@ class RedisEmailClient:
 
     async def get_stats(self) -> Dict:
         """Get email system statistics"""
-        stats = await self.redis.hgetall("email:stats:daily")
+        priorities = list(EmailPriority)
+        providers = list(self.config.rate_limits)
+
+        # All reads go out in one pipeline (one round trip instead of one per key)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall("email:stats:daily")
+        for priority in priorities:
+            pipe.xlen(f"email:queue:{priority.value}")
+        for provider in providers:
+            pipe.hmget(f"rate_limit:{provider}", "tokens", "last_refill")
+        results = await self.redis.execute_pipeline(pipe)
+
+        stats = results[0]
+        queue_lengths = results[1 : 1 + len(priorities)]
+        buckets = results[1 + len(priorities) :]
 
         # Queue lengths
-        for priority in EmailPriority:
-            stream_key = f"email:queue:{priority.value}"
-            length = await self.redis.xlen(stream_key)
+        for priority, length in zip(priorities, queue_lengths):
             stats[f"queue_{priority.value}"] = length
 
         # Rate limit status
-        for provider in self.config.rate_limits:
-            bucket = await self.redis.hmget(f"rate_limit:{provider}", "tokens", "last_refill")
+        for provider, bucket in zip(providers, buckets):
             if bucket[0]:
                 stats[f"rate_{provider}_tokens"] = bucket[0]
 
@@ -7,7 +7,7 @@ import os
 import time
 
 from config.logging_config import setup_logging
-from email_system import EmailConfig, EmailJob, EmailService
+from email_system import EmailConfig, EmailService
 
 # Configure logging using centralized configuration
 # This sets up Docker-compatible logging (stdout/stderr only)
@@ -28,6 +28,7 @@ class EmailScheduler:
         )
         self.email_service = EmailService(self.config)
         self.interval = int(os.getenv("SCHEDULE_INTERVAL", 60))  # Check every 60 seconds
+        self.batch_size = int(os.getenv("SCHEDULE_BATCH_SIZE", 500))  # Jobs promoted per Redis call
         self.running = True
 
     async def start(self):
@@ -45,39 +46,19 @@ class EmailScheduler:
 
     async def process_scheduled_emails(self):
         """Process emails scheduled for delivery"""
-        current_time = int(time.time())
-
-        # Get emails ready for delivery
-        redis = self.email_service.redis_client.redis
-        scheduled_jobs = await redis.zrangebyscore(
-            "email:scheduled", 0, current_time, withscores=True
-        )
+        current_time = time.time()
+        redis_client = self.email_service.redis_client
 
+        # Each call promotes one batch of due jobs atomically in Redis;
+        # keep going while full batches come back
         processed = 0
-        for job_id, timestamp in scheduled_jobs:
-            try:
-                # Get job data
-                job_data = await redis.get(f"email:job:{job_id}")
-                if not job_data:
-                    # Job expired or already processed
-                    await redis.zrem("email:scheduled", job_id)
-                    continue
-
-                # Parse job
-                job = EmailJob.parse_raw(job_data)
-
-                # Queue for immediate processing
-                await self.email_service.redis_client.enqueue_email(job)
-
-                # Remove from scheduled queue
-                await redis.zrem("email:scheduled", job_id)
-                await redis.delete(f"email:job:{job_id}")
-
-                processed += 1
+        while True:
+            due, promoted = await redis_client.promote_scheduled(current_time, self.batch_size)
+            for job_id in promoted:
                 logger.info("Scheduled email %s queued for delivery", job_id)
-
-            except Exception as e:
-                logger.error("Error processing scheduled job %s: %s", job_id, e)
+            processed += len(promoted)
+            if due < self.batch_size:
+                break
 
         if processed > 0:
             logger.info("Processed %s scheduled emails", processed)
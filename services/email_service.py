@@ -4,7 +4,8 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Union
 
 from config.email_config import EmailConfig
@@ -47,7 +48,7 @@ class EmailService:
         data: Dict = None,
         priority: EmailPriority = EmailPriority.MEDIUM,
         provider: EmailProvider = EmailProvider.SMTP,
-        scheduled_at: Optional[datetime] = None,
+        scheduled_at: Union[float, datetime, None] = None,
     ) -> str:
         """
         Send email - Main API function
@@ -58,7 +59,8 @@ class EmailService:
             data: Template data
             priority: Email priority (high/medium/low)
             provider: Email provider to use
-            scheduled_at: When to send (None = immediate)
+            scheduled_at: When to send, as epoch seconds or datetime (None = immediate).
+                Naive datetimes are interpreted as UTC.
 
         Returns:
             Job ID for tracking
@@ -66,6 +68,12 @@ class EmailService:
         if data is None:
             data = {}
 
+        # Coerce once to an epoch float; it is used directly as the ZADD score
+        if isinstance(scheduled_at, datetime):
+            if scheduled_at.tzinfo is None:
+                scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
+            scheduled_at = scheduled_at.timestamp()
+
         # Log the incoming request at DEBUG level
         logger.debug(
             "send_email called: recipients=%s, template=%s, priority=%s, provider=%s, scheduled=%s",
@@ -97,10 +105,10 @@ class EmailService:
             log_data_structure(logger, "EmailJob %s" % job.job_id, job)
 
         # Queue the job
-        if scheduled_at and scheduled_at > datetime.utcnow():
+        if scheduled_at and scheduled_at > time.time():
             # Schedule for later
             logger.debug("Scheduling email %s for %s", job.job_id, scheduled_at)
-            await self._schedule_email(job)
+            await self._schedule_email(job, scheduled_at)
             logger.info("Email scheduled: %s, delivery at: %s", job.job_id, scheduled_at)
         else:
             # Queue immediately
@@ -129,39 +137,24 @@ class EmailService:
 
             logger.debug("Expanding group: %s", group_id)
 
-            with log_timing(f"redis_lrange_group_{group_id}", logger):
-                member_emails = await self.redis_client.redis.lrange(
-                    f"group:{group_id}:emails", 0, -1
-                )
-
-            logger.debug("Group %s has %s member(s)", group_id, len(member_emails))
-
-            # Remove excluded members
-            with log_timing(f"redis_lrange_excluded_{group_id}", logger):
-                excluded = await self.redis_client.redis.lrange(f"group:{group_id}:excluded", 0, -1)
+            # The member list is cached in Redis for config.group_cache_ttl
+            # seconds; exclusions are applied fresh on every expansion
+            with log_timing(f"redis_expand_group_{group_id}", logger):
+                member_emails = await self.redis_client.expand_group(group_id)
 
-            if excluded:
-                logger.debug("Group %s has %s excluded member(s)", group_id, len(excluded))
-                filtered = [email for email in member_emails if email not in excluded]
-                logger.debug("After filtering: %s recipient(s)", len(filtered))
-                return filtered
+            logger.debug("Group %s resolved to %s recipient(s)", group_id, len(member_emails))
 
             return member_emails
 
         logger.debug("Single recipient: %s", recipients)
         return [recipients]  # Single email
 
-    async def _schedule_email(self, job: EmailJob):
-        """Schedule email for future delivery"""
-        timestamp = int(job.scheduled_at.timestamp())
-
-        logger.debug("Scheduling job %s for timestamp %s (%s)", job.job_id, timestamp, job.scheduled_at)
-
-        with log_timing(f"redis_zadd_scheduled_{job.job_id}", logger):
-            await self.redis_client.redis.zadd("email:scheduled", {job.job_id: timestamp})
+    async def _schedule_email(self, job: EmailJob, timestamp: float):
+        """Schedule email for future delivery at the given epoch timestamp"""
+        logger.debug("Scheduling job %s for timestamp %s", job.job_id, timestamp)
 
-        with log_timing(f"redis_set_job_{job.job_id}", logger):
-            await self.redis_client.redis.set(f"email:job:{job.job_id}", job.json(), ex=86400 * 7)
+        with log_timing(f"redis_schedule_{job.job_id}", logger):
+            await self.redis_client.schedule_email(job, timestamp, ttl=86400 * 7)
 
         logger.debug("Job %s scheduled successfully", job.job_id)
 
@@ -64,15 +64,15 @@ def log_function_call(func: Callable) -> Callable:
 
         logger.debug("→ Calling %s(%s)", func.__name__, _format_params(sanitized_args))
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = await func(*args, **kwargs)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             logger.debug("← %s completed in %.3fs", func.__name__, elapsed)
             return result
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.error("✗ %s failed after %.3fs: %s", func.__name__, elapsed, e, exc_info=True)
             raise
 
@@ -87,15 +87,15 @@ def log_function_call(func: Callable) -> Callable:
 
         logger.debug("→ Calling %s(%s)", func.__name__, _format_params(sanitized_args))
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             logger.debug("← %s completed in %.3fs", func.__name__, elapsed)
             return result
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.error("✗ %s failed after %.3fs: %s", func.__name__, elapsed, e, exc_info=True)
             raise
 
@@ -123,14 +123,14 @@ def log_timing(operation_name: str, logger: Optional[logging.Logger] = None):
         logger = logging.getLogger(__name__)
 
     logger.debug("⏱ Starting: %s", operation_name)
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         yield
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.debug("✓ %s completed in %.3fs", operation_name, elapsed)
     except Exception as e:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.error("✗ %s failed after %.3fs: %s", operation_name, elapsed, e, exc_info=True)
         raise
 